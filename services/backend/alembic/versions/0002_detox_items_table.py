@@ -0,0 +1,60 @@
+"""Detox items table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Create the detox_items table
+    op.create_table(
+        'detox_items',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),  # Owner of the item
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('original_text', sa.Text(), nullable=False),
+        sa.Column('analysis', sa.Text(), nullable=True),  # Filled in once processing completes
+        sa.Column('is_sensational', sa.Boolean(), nullable=True, server_default='false'),
+        sa.Column('confidence', sa.Float(), nullable=True, server_default='0'),
+        sa.Column('entities', postgresql.JSONB(astext_type=sa.Text()), nullable=True, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('similar_items', postgresql.JSONB(astext_type=sa.Text()), nullable=True, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('meme_task_id', sa.String(), nullable=True),
+        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    
+    # Create indexes
+    op.create_index(op.f('ix_detox_items_id'), 'detox_items', ['id'], unique=False)
+    op.create_index(op.f('ix_detox_items_is_sensational'), 'detox_items', ['is_sensational'], unique=False)
+    op.create_index(op.f('ix_detox_items_meme_task_id'), 'detox_items', ['meme_task_id'], unique=False)
+    # Serves "a user's items, newest first" as an index range scan
+    op.create_index(
+        'ix_detox_items_user_created',
+        'detox_items',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_include=['status'],
+    )
+
+def downgrade() -> None:
+    # Drop indexes first
+    op.drop_index('ix_detox_items_user_created', table_name='detox_items')
+    op.drop_index(op.f('ix_detox_items_meme_task_id'), table_name='detox_items')
+    op.drop_index(op.f('ix_detox_items_is_sensational'), table_name='detox_items')
+    op.drop_index(op.f('ix_detox_items_id'), table_name='detox_items')
+    
+    # Drop the detox_items table
+    op.drop_table('detox_items')
@@ -1,21 +1,110 @@
 """Dependencies for FastAPI endpoints."""
-from typing import Generator, Optional
+import logging
+from typing import Any, Dict, Generator, Optional
+from uuid import UUID
 
+import httpx
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from gotrue.errors import AuthError
 from jose import JWTError, jwt
 from pydantic import ValidationError
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core.config import settings
-from app.core.security import ALGORITHM
+from app.core.security import ALGORITHM, cached_verify
 from app.db.deps import get_db
 from app.models.user_model import User
 from app.services.user_sync import UserSyncService, get_user_sync_service
 
+logger = logging.getLogger(__name__)
+
 # Reusable HTTP Bearer token security scheme
 security = HTTPBearer(auto_error=False)
 
+# Settings read on every request, resolved once at import
+_COOKIE_NAME = settings.SUPABASE_AUTH_COOKIE_NAME
+_JWT_SECRET = settings.SUPABASE_JWT_SECRET
+
+# Verification settings for jwt.decode, built once instead of per request
+_JWT_DECODE_KWARGS: Dict[str, Any] = {
+    "key": _JWT_SECRET,
+    "algorithms": [ALGORITHM],
+    "audience": "authenticated",
+    "options": {"verify_aud": True},
+}
+
+# Verified JWT payloads keyed by token digest, so repeat requests skip HMAC + parse
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+# Column values of recently synced users keyed by user ID (per process; 60 s
+# staleness is acceptable for auth). Snapshots rather than ORM instances, which
+# stay bound to the session that loaded them.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+# users.is_superuser by user ID, for JWT-only endpoints that only need the flag
+_superuser_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a cached user so the next request re-syncs it from Supabase Auth."""
+    _user_cache.pop(str(user_id), None)
+    _superuser_cache.pop(str(user_id), None)
+
+
+def _snapshot(user: User) -> Dict[str, Any]:
+    """Copy a user's column values, independent of the session that loaded it."""
+    return {attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs}
+
+
+async def _user_from_snapshot(db: AsyncSession, snapshot: Dict[str, Any]) -> User:
+    """Rebuild a cached user as a persistent instance of ``db``, without a query."""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def _verify_token(token: str) -> Dict[str, Any]:
+    """Verify a JWT signed with the project's shared secret."""
+    return jwt.decode(token, **_JWT_DECODE_KWARGS)
+
+
+async def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode and verify a JWT, reusing a recently verified payload when possible."""
+    return await cached_verify(token, _verify_token, _jwt_cache)
+
+
+async def _get_token_payload(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials],
+) -> Optional[Dict[str, Any]]:
+    """Verify the request's JWT, from the Authorization header or the auth cookie."""
+    # Try to get token from Authorization header
+    token = None
+    if credentials is not None:
+        token = credentials.credentials
+    else:
+        # Try to get token from cookies
+        token = request.cookies.get(_COOKIE_NAME)
+    
+    # No header and no cookie: skip verification entirely
+    if not token:
+        return None
+    
+    try:
+        # Decode the JWT token (served from cache for recently seen tokens)
+        return await _decode_token(token)
+    except (JWTError, ValidationError):
+        # Log the error but don't fail yet - we'll handle this in get_current_user
+        return None
+
+
 async def get_current_user_id(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -42,42 +131,65 @@ async def get_current_user_id(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    # Try to get token from Authorization header
-    token = None
-    if credentials is not None:
-        token = credentials.credentials
-    else:
-        # Try to get token from cookies
-        token = request.cookies.get(settings.SUPABASE_AUTH_COOKIE_NAME)
-    
-    if not token:
+    payload = await _get_token_payload(request, credentials)
+    if payload is None:
         return None
     
-    try:
-        # Decode the JWT token
-        payload = jwt.decode(
-            token,
-            settings.SUPABASE_JWT_SECRET,
-            algorithms=[ALGORITHM],
-            audience="authenticated",
-            options={"verify_aud": True},
+    # Get user ID from token
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+    
+    return user_id
+
+
+async def get_required_user_id(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> str:
+    """
+    Get the current user ID, requiring a valid token.
+    
+    Unlike ``get_current_user`` this only verifies the JWT and never touches the
+    database, which makes it suitable for high-frequency endpoints such as
+    status polling.
+    
+    Raises:
+        HTTPException: If no valid token was provided
+    """
+    payload = await _get_token_payload(request, credentials)
+    if not payload or not payload.get("sub"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        
-        # Get user ID from token
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-            
-        return user_id
-        
-    except (JWTError, ValidationError) as exc:
-        # Log the error but don't fail yet - we'll handle this in get_current_user
-        return None
+    return payload["sub"]
+
+
+async def is_superuser(db: AsyncSession, user_id: str) -> bool:
+    """
+    Whether ``user_id`` is a superuser, per the ``users.is_superuser`` column.
+    
+    The column (set for FIRST_SUPERUSER by init_db) is the source of truth for
+    superuser access. The flag is cached for 60 s like ``_user_cache``; a user
+    with no local row is not a superuser.
+    """
+    flag = _superuser_cache.get(user_id)
+    if flag is None:
+        try:
+            uid = UUID(user_id)
+        except ValueError:
+            return False
+        flag = bool(await db.scalar(select(User.is_superuser).where(User.id == uid)))
+        _superuser_cache[user_id] = flag
+    return flag
 
 async def get_current_user(
     request: Request,
     db: AsyncSession = Depends(get_db),
     user_sync: UserSyncService = Depends(get_user_sync_service),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> User:
     """
     Get the current authenticated user.
@@ -85,13 +197,15 @@ async def get_current_user(
     This dependency will:
     1. Extract and validate the JWT token from the request
     2. Get the user ID from the token
-    3. Sync the user from Supabase Auth to the local database
+    3. Sync the user from Supabase Auth to the local database, unless it was
+       synced recently and is still cached
     4. Return the user object
     
     Args:
         request: The FastAPI request object
         db: The database session
         user_sync: The user sync service
+        credentials: The HTTP Authorization header
         
     Returns:
         The authenticated user
@@ -106,21 +220,29 @@ async def get_current_user(
     )
     
     # Get the current user ID from the JWT token
-    user_id = await get_current_user_id(request)
+    user_id = await get_current_user_id(request, credentials)
     if not user_id:
         raise credentials_exception
     
+    snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        return await _user_from_snapshot(db, snapshot)
+    
     try:
         # Sync the user from Supabase Auth to the local database
         user = await user_sync.sync_user_from_supabase(user_id)
         if not user:
             raise credentials_exception
-            
+        
+        _user_cache[user_id] = _snapshot(user)
         return user
         
-    except Exception as exc:
-        # Log the error and return 401
+    except HTTPException:
         raise credentials_exception
+    except (SQLAlchemyError, httpx.HTTPError, AuthError) as exc:
+        # Log the error and return 401
+        logger.warning("User sync failed for %s: %s", user_id, exc)
+        raise credentials_exception from exc
 
 # Dependency to get the current active user (must be authenticated and active)
 async def get_current_active_user(
@@ -1,18 +1,24 @@
 """API endpoints for the detox pipeline."""
 import logging
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
+from sqlalchemy import cast, func, insert, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user, get_required_user_id, is_superuser
 from app.models.user_model import User
-from app.services.detox.pipeline import DetoxPipeline, DetoxAnalysis
-from app.db.config import get_db as get_db_session
+from app.db.deps import task_session
 from app.models.detox_model import DetoxItem
+from app.tasks.detox import process_detox as process_detox_task
+
+if TYPE_CHECKING:
+    from app.services.detox.pipeline import DetoxPipeline
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,6 +35,8 @@ class DetoxRequest(BaseModel):
 
 class DetoxResponse(BaseModel):
     """Response model for detox pipeline."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str = Field(..., description="Detox item ID")
     status: str = Field(..., description="Processing status")
     original_text: str = Field(..., description="Original input text")
@@ -42,8 +50,18 @@ class DetoxResponse(BaseModel):
 # Create router
 router = APIRouter()
 
-# Initialize pipeline
-pipeline = DetoxPipeline()
+
+@lru_cache(maxsize=1)
+def get_pipeline() -> "DetoxPipeline":
+    """
+    Get the process-wide detox pipeline, creating it on first use.
+    
+    The pipeline module loads spaCy, the embedding model and the Qdrant client
+    at import time, so it is only imported by processes that actually run it.
+    """
+    from app.services.detox.pipeline import DetoxPipeline
+    
+    return DetoxPipeline()
 
 
 async def process_detox_pipeline(
@@ -66,7 +84,7 @@ async def process_detox_pipeline(
     """
     try:
         # Process the text through the pipeline
-        result = await pipeline.process(
+        result = await get_pipeline().process(
             text=text,
             db=db,
             generate_meme=generate_meme
@@ -102,36 +120,42 @@ async def process_detox_pipeline(
 )
 async def process_text(
     request: DetoxRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db),
 ) -> DetoxResponse:
     """
     Process text through the detox pipeline.
     
-    This endpoint starts a background task to process the text and returns immediately
+    This endpoint queues a Celery task to process the text and returns immediately
     with a task ID that can be used to check the status of the processing.
     """
     try:
-        # Create a new detox item in the database
-        detox_item = DetoxItem(
-            original_text=request.text,
-            status="pending",
-            user_id=current_user.id if current_user else None
+        # Create a new detox item in the database; RETURNING yields the generated
+        # ID in the same round-trip as the INSERT
+        stmt = (
+            insert(DetoxItem)
+            .values(
+                original_text=request.text,
+                status="pending",
+                user_id=current_user.id if current_user else None,
+            )
+            .returning(DetoxItem.id, DetoxItem.created_at)
         )
+        detox_item = (await db.execute(stmt)).one()
         
-        db.add(detox_item)
+        # Commit on the request's session, which get_current_user may already
+        # have used (and so begun a transaction on), and release the pooled
+        # connection before the task is dispatched
         await db.commit()
-        await db.refresh(detox_item)
         
-        # Start background task to process the text
-        background_tasks.add_task(
-            process_detox_background,
-            detox_id=detox_item.id,
-            text=request.text,
-            generate_meme=request.generate_meme,
-            user_id=current_user.id if current_user else None
-        )
+        # Hand the processing off to a detox worker only once the row is
+        # committed, so a failed commit never enqueues an orphan task
+        process_detox_task.apply_async(args=[
+            str(detox_item.id),
+            request.text,
+            request.generate_meme,
+            str(current_user.id) if current_user else None,
+        ])
         
         return DetoxResponse(
             id=str(detox_item.id),
@@ -147,6 +171,17 @@ async def process_text(
         )
 
 
+def _merge_metadata(patch: Dict[str, Any]):
+    """
+    SQL expression that merges ``patch`` into a detox item's stored metadata.
+    
+    Uses the Postgres jsonb ``||`` operator so an UPDATE only ships the changed
+    keys instead of rewriting the whole metadata document.
+    """
+    current = func.coalesce(DetoxItem.metadata_, cast({}, JSONB))
+    return current.op("||")(cast(patch, JSONB))
+
+
 async def process_detox_background(
     detox_id: UUID,
     text: str,
@@ -154,7 +189,9 @@ async def process_detox_background(
     user_id: Optional[UUID] = None
 ) -> None:
     """
-    Background task to process text through the detox pipeline.
+    Process a stored detox item through the pipeline and persist the results.
+    
+    Runs inside a detox Celery worker (see ``app.tasks.detox``).
     
     Args:
         detox_id: ID of the detox item
@@ -162,14 +199,8 @@ async def process_detox_background(
         generate_meme: Whether to generate a meme if content is sensational
         user_id: Optional user ID for attribution
     """
-    async with get_db_session() as db:
+    async with task_session() as db:
         try:
-            # Get the detox item
-            detox_item = await db.get(DetoxItem, detox_id)
-            if not detox_item:
-                logger.error(f"Detox item not found: {detox_id}")
-                return
-                
             # Process the text through the pipeline
             result = await process_detox_pipeline(
                 db=db,
@@ -180,34 +211,47 @@ async def process_detox_background(
             
             # Update the detox item with the results
             if result["status"] == "completed":
-                detox_item.status = "completed"
-                detox_item.masked_text = result.get("masked_text")
-                detox_item.analysis = result.get("analysis", {}).get("analysis")
-                detox_item.is_sensational = result.get("analysis", {}).get("is_sensational", False)
-                detox_item.confidence = result.get("analysis", {}).get("confidence", 0.0)
-                detox_item.entities = result.get("entities", [])
-                detox_item.similar_items = result.get("similar_items", [])
-                detox_item.meme_task_id = result.get("meme_data", {}).get("task_id") if result.get("meme_data") else None
-                detox_item.metadata = {
-                    "key_points": result.get("analysis", {}).get("key_points", []),
-                    "meme_status": "pending" if result.get("meme_data") else None
+                analysis = result.get("analysis", {})
+                meme_data = result.get("meme_data")
+                values = {
+                    "status": "completed",
+                    "masked_text": result.get("masked_text"),
+                    "analysis": analysis.get("analysis"),
+                    "is_sensational": analysis.get("is_sensational", False),
+                    "confidence": analysis.get("confidence", 0.0),
+                    "entities": result.get("entities", []),
+                    "similar_items": result.get("similar_items", []),
+                    "meme_task_id": meme_data.get("task_id") if meme_data else None,
+                    "metadata_": _merge_metadata({
+                        "key_points": analysis.get("key_points", []),
+                        "meme_status": "pending" if meme_data else None
+                    }),
                 }
             else:
-                detox_item.status = "error"
-                detox_item.metadata = {
-                    "error": result.get("error", "Unknown error")
+                values = {
+                    "status": "error",
+                    "metadata_": _merge_metadata({
+                        "error": result.get("error", "Unknown error")
+                    }),
                 }
             
+            updated = await db.execute(
+                update(DetoxItem).where(DetoxItem.id == detox_id).values(**values)
+            )
+            if updated.rowcount == 0:
+                logger.error(f"Detox item not found: {detox_id}")
             await db.commit()
             
         except Exception as e:
             logger.error(f"Error in background detox processing: {e}", exc_info=True)
             try:
                 # Try to update the detox item with the error
-                detox_item.status = "error"
-                detox_item.metadata = {
-                    "error": str(e)
-                }
+                await db.rollback()
+                await db.execute(
+                    update(DetoxItem)
+                    .where(DetoxItem.id == detox_id)
+                    .values(status="error", metadata_=_merge_metadata({"error": str(e)}))
+                )
                 await db.commit()
             except Exception as inner_e:
                 logger.error(f"Error updating detox item with error: {inner_e}", exc_info=True)
@@ -223,12 +267,15 @@ async def process_detox_background(
 )
 async def get_detox_status(
     detox_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
+    caller_id: str = Depends(get_required_user_id),
+    db: AsyncSession = Depends(get_db),
 ) -> DetoxResponse:
     """
     Get the status of a detox processing task.
     
+    Only the JWT is verified for the item's owner; anyone else must be a
+    superuser in the database.
+    
     Args:
         detox_id: ID of the detox item
         
@@ -236,21 +283,20 @@ async def get_detox_status(
         DetoxResponse with current status
     """
     try:
-        # Get the detox item
-        detox_item = await db.get(DetoxItem, detox_id)
+        # Users can only see their own items unless they are a superuser; the
+        # superuser flag is only looked up for someone else's item. Items the
+        # user may not see are reported as not found.
+        stmt = select(DetoxItem).where(DetoxItem.id == detox_id)
+        detox_item = (await db.execute(stmt)).scalar_one_or_none()
+        if detox_item and str(detox_item.user_id) != caller_id:
+            if not await is_superuser(db, caller_id):
+                detox_item = None
         if not detox_item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Detox item not found: {detox_id}"
             )
         
-        # Check permissions (users can only see their own items or admin)
-        if current_user and current_user.id != detox_item.user_id and not current_user.is_superuser:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this resource"
-            )
-        
         return DetoxResponse(
             id=str(detox_item.id),
             status=detox_item.status,
@@ -259,7 +305,7 @@ async def get_detox_status(
             is_sensational=detox_item.is_sensational,
             confidence=detox_item.confidence,
             meme_task_id=detox_item.meme_task_id,
-            error=detox_item.metadata.get("error") if detox_item.status == "error" else None
+            error=detox_item.metadata_.get("error") if detox_item.status == "error" else None
         )
         
     except HTTPException:
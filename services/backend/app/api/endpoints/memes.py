@@ -1,15 +1,30 @@
 """API endpoints for meme generation."""
+import asyncio
+
+from typing import Any, Dict
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user, get_required_user_id
+from app.core.redis import get_redis_client
 from app.models.user_model import User
 from app.schemas.meme import MemeCreate, MemeResponse, MemeStatus
-from app.tasks.meme_generation import generate_meme_async
+from app.core.celery import RESULT_EXPIRES, app as celery_app
 
 router = APIRouter()
 
+# How long a meme task's ownership record is kept: as long as its Celery
+# result, so once the result expires a status poll answers 404 rather than
+# reporting the forgotten task as PENDING forever
+MEME_TASK_TTL = RESULT_EXPIRES
+
+
+def _meme_task_key(task_id: str) -> str:
+    """Redis key holding metadata for a meme generation task."""
+    return f"meme:{task_id}"
+
 @router.post(
     "/generate",
     response_model=MemeResponse,
@@ -32,13 +47,26 @@ async def create_meme(
     with a task ID that can be used to check the status of the generation.
     """
     try:
-        # Start the Celery task
-        task = generate_meme.delay(
-            headline=meme_data.headline,
-            analysis=meme_data.analysis,
-            style=meme_data.style
+        # Start the Celery task by name so the web process never imports the
+        # task module (and its OpenAI/Supabase dependencies)
+        task = celery_app.send_task(
+            "memes.generate",
+            kwargs={
+                "headline": meme_data.headline,
+                "analysis": meme_data.analysis,
+                "style": meme_data.style,
+            },
+            queue="memes",
         )
         
+        # Record the owner so status polls can be authorized without a DB lookup
+        # (the record and its expiry in one round-trip, applied atomically)
+        key = _meme_task_key(task.id)
+        async with get_redis_client().pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"owner_user_id": str(current_user.id)})
+            pipe.expire(key, MEME_TASK_TTL)
+            await pipe.execute()
+        
         return MemeResponse(
             status=MemeStatus.PENDING,
             task_id=task.id,
@@ -62,45 +90,58 @@ async def create_meme(
 )
 async def check_meme_status(
     task_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> MemeResponse:
+    user_id: str = Depends(get_required_user_id),
+) -> Dict[str, Any]:
     """
     Check the status of a meme generation task.
     
+    Only the JWT is verified (no database lookup); access is authorized by the
+    owner recorded for the task when it was started.
+    
     Args:
         task_id: The ID of the Celery task
         
     Returns:
-        Current status and result (if available) of the task
+        Current status and result (if available) of the task, shaped by
+        ``MemeResponse``
     """
     from celery.result import AsyncResult
-    from app.core.celery import app as celery_app
+    
+    owner_user_id = await get_redis_client().hget(_meme_task_key(task_id), "owner_user_id")
+    if owner_user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meme generation task not found"
+        )
     
     task = AsyncResult(task_id, app=celery_app)
     
-    if task.state == 'PENDING':
-        return MemeResponse(
-            status=MemeStatus.PENDING,
-            task_id=task_id,
-            message="Meme generation in progress"
-        )
-    elif task.state == 'SUCCESS':
-        return MemeResponse(
-            status=MemeStatus.COMPLETED,
-            task_id=task_id,
-            message="Meme generated successfully",
-            data=task.result
-        )
-    elif task.state == 'FAILURE':
-        return MemeResponse(
-            status=MemeStatus.FAILED,
-            task_id=task_id,
-            message=f"Meme generation failed: {str(task.result)}"
-        )
+    # Reading state/result hits the result backend synchronously; keep it off
+    # the event loop
+    state, result = await asyncio.to_thread(lambda: (task.state, task.result))
+    
+    if state == 'PENDING':
+        return {
+            "status": MemeStatus.PENDING,
+            "task_id": task_id,
+            "message": "Meme generation in progress",
+        }
+    elif state == 'SUCCESS':
+        return {
+            "status": MemeStatus.COMPLETED,
+            "task_id": task_id,
+            "message": "Meme generated successfully",
+            "data": result,
+        }
+    elif state == 'FAILURE':
+        return {
+            "status": MemeStatus.FAILED,
+            "task_id": task_id,
+            "message": f"Meme generation failed: {str(result)}",
+        }
     else:
-        return MemeResponse(
-            status=MemeStatus.PENDING,
-            task_id=task_id,
-            message=f"Meme generation status: {task.state}"
-        )
+        return {
+            "status": MemeStatus.PENDING,
+            "task_id": task_id,
+            "message": f"Meme generation status: {state}",
+        }
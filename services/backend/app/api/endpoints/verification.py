@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, invalidate_user
 from app.models.user_model import User
 from app.schemas.verification import (
     VerificationStatusResponse,
@@ -51,6 +51,8 @@ async def check_verification_status(
         str(current_user.id), 
         verification_type
     )
+    # The check may have refreshed the user's verification metadata
+    invalidate_user(str(current_user.id))
     return {"success": True, "data": result}
 
 @router.post(
@@ -118,4 +120,5 @@ async def verify_phone_with_code(
         request.phone,
         request.token
     )
+    invalidate_user(result["user_id"])
     return {"success": True, "data": result}
@@ -29,6 +29,12 @@ def create_queues():
             routing_key='memes',
             queue_arguments={'x-max-priority': 10}
         ),
+        Queue(
+            'detox',
+            Exchange('detox'),
+            routing_key='detox',
+            queue_arguments={'x-max-priority': 10}
+        ),
     ]
 
 # Setup task queues
@@ -37,7 +43,18 @@ app.conf.task_default_queue = 'default'
 app.conf.task_default_exchange = 'default'
 app.conf.task_default_routing_key = 'default'
 
+# Serialization (msgpack is smaller and faster than JSON for text-heavy payloads)
+app.conf.task_serializer = 'msgpack'
+app.conf.result_serializer = 'msgpack'
+app.conf.accept_content = ['msgpack', 'json']
+
 # Task settings
+# Results are only stored for tasks that opt in with ignore_result=False
+# (i.e. tasks whose AsyncResult is polled)
+app.conf.task_ignore_result = True
+# Seconds stored results are kept (the API's meme task records match it)
+RESULT_EXPIRES = 3600
+app.conf.result_expires = RESULT_EXPIRES
 app.conf.task_acks_late = True
 app.conf.task_reject_on_worker_lost = True
 app.conf.worker_prefetch_multiplier = 1
@@ -58,10 +75,12 @@ def autodiscover_tasks():
     """Auto-discover tasks in all installed apps."""
     return app.autodiscover_tasks(['app.tasks'])
 
-# Load task modules from all registered Django app configs.
-autodiscover_tasks()
+# Load task modules only in worker processes; the API dispatches by task name
+# (send_task) and doesn't need the task modules imported.
+if os.environ.get("CELERY_WORKER_RUNNING"):
+    autodiscover_tasks()
 
-@app.task(bind=True)
+@app.task(bind=True, ignore_result=True)
 def debug_task(self):
     """Debug task to check Celery is working."""
     print(f'Request: {self.request!r}')
@@ -1,12 +1,14 @@
-from pydantic import AnyHttpUrl, PostgresDsn, RedisDsn, field_validator
+from pydantic import AnyHttpUrl, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Any, Dict, List, Literal, Optional, Union
-import os
+from typing import Any, FrozenSet, List, Optional, Union
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 # Base directory
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+VALID_ENVIRONMENTS = frozenset({"development", "testing", "production"})
+
 class Settings(BaseSettings):
     # Project settings
     PROJECT_NAME: str = "ZeitWise Backend"
@@ -17,6 +19,8 @@ class Settings(BaseSettings):
     
     # API settings
     API_V1_STR: str = "/api/v1"
+    # Optional routers to mount, comma-separated; slim deployments can drop some
+    FEATURES: str = "auth,verification,memes"
     SECRET_KEY: str = "your-secret-key-here"  # Change in production!
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     
@@ -34,6 +38,14 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "zeitwise"
     DATABASE_URI: Optional[PostgresDsn] = None
     
+    # Connection pool, per worker process. Keep
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) x uvicorn workers x replicas below
+    # Postgres max_connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    
     # Redis settings
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -51,6 +63,7 @@ class Settings(BaseSettings):
     SUPABASE_REFRESH_COOKIE_NAME: str = "sb-refresh-token"
     SUPABASE_TOKEN_EXPIRY: int = 3600  # 1 hour
     SUPABASE_REFRESH_TOKEN_EXPIRY: int = 60 * 60 * 24 * 7  # 7 days
+    AUTH_CACHE_TTL: int = 30  # seconds a verified token is reused; 0 disables
     
     # LLM settings
     OPENAI_API_KEY: str = ""
@@ -74,42 +87,65 @@ class Settings(BaseSettings):
         extra="ignore"
     )
     
-    @property
+    @cached_property
+    def DATABASE_DSN(self) -> str:
+        """Driver-independent ``user:password@host/db`` part of the database URL."""
+        return f"{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+    
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Generate database URL from environment variables."""
         if self.DATABASE_URI is not None:
             return str(self.DATABASE_URI)
-        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+        return f"postgresql+asyncpg://{self.DATABASE_DSN}"
     
-    @property
+    @cached_property
     def SYNC_DATABASE_URL(self) -> str:
         """Generate synchronous database URL for Alembic."""
         if self.DATABASE_URI is not None:
-            return str(self.DATABASE_URI).replace("postgresql+asyncpg", "postgresql")
-        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
-    
-    @property
+            from sqlalchemy.engine import make_url
+            
+            # Swap whatever driver DATABASE_URI names for the dialect default
+            url = make_url(str(self.DATABASE_URI))
+            return url.set(drivername=url.get_backend_name()).render_as_string(hide_password=False)
+        return f"postgresql://{self.DATABASE_DSN}"
+    
+    @cached_property
     def REDIS_URL(self) -> str:
         """Generate Redis URL from environment variables."""
         if self.REDIS_PASSWORD:
             return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
     
+    @cached_property
+    def CORS_ORIGINS(self) -> FrozenSet[str]:
+        """CORS origins as normalized strings, for O(1) origin checks."""
+        return frozenset(str(origin).rstrip("/") for origin in self.BACKEND_CORS_ORIGINS)
+    
+    @cached_property
+    def FEATURE_SET(self) -> FrozenSet[str]:
+        """Enabled optional features as a set of names."""
+        return frozenset(f.strip() for f in self.FEATURES.split(",") if f.strip())
+    
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         """Parse CORS origins from string or list."""
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
+        if isinstance(v, list):
             return v
+        if isinstance(v, str):
+            if v.startswith("["):
+                return v
+            if "," not in v:
+                return [v.strip()]
+            return [i.strip() for i in v.split(",")]
         raise ValueError(v)
     
     @field_validator("ENVIRONMENT")
     @classmethod
     def check_environment(cls, v: str) -> str:
         """Validate environment value."""
-        if v not in ["development", "testing", "production"]:
+        if v not in VALID_ENVIRONMENTS:
             raise ValueError("ENVIRONMENT must be one of: development, testing, production")
         return v
     
@@ -128,5 +164,14 @@ class Settings(BaseSettings):
         """Check if running tests."""
         return self.TESTING
 
-# Create settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings instance once, on first use."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve ``settings`` lazily so importing this module doesn't read .env
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Configuration for the detox pipeline."""
 from typing import Dict, Any, List, Optional
-from pydantic import BaseSettings, Field, validator
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class DetoxSettings(BaseSettings):
     """Settings for the detox pipeline."""
@@ -63,13 +64,16 @@ class DetoxSettings(BaseSettings):
         description="Logging level"
     )
     
-    class Config:
-        env_prefix = "DETOX_"
-        case_sensitive = False
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_prefix="DETOX_",
+        case_sensitive=False,
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore"
+    )
     
-    @validator("ENTITY_TYPES", pre=True)
+    @field_validator("ENTITY_TYPES", mode="before")
+    @classmethod
     def parse_entity_types(cls, v):
         """Parse entity types from comma-separated string if needed."""
         if isinstance(v, str):
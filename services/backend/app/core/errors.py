@@ -0,0 +1,40 @@
+"""Shared error handling for route handlers."""
+import functools
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def safe_endpoint(
+    detail: str,
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+) -> Callable[[F], F]:
+    """
+    Turn unexpected exceptions raised by an async endpoint into an HTTPException.
+    
+    HTTPExceptions pass through unchanged; anything else is logged against the
+    endpoint's module and re-raised as ``status_code`` with ``detail``, which
+    may reference the endpoint's keyword arguments (e.g. ``"{provider} login"``).
+    """
+    def decorator(endpoint: F) -> F:
+        logger = logging.getLogger(endpoint.__module__)
+        
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await endpoint(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as exc:
+                logger.exception("Unhandled error in %s", endpoint.__name__)
+                raise HTTPException(
+                    status_code=status_code,
+                    detail=detail.format(**kwargs),
+                ) from exc
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
@@ -0,0 +1,33 @@
+"""Shared outbound HTTP client."""
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+# Default timeout for outbound requests, in seconds
+HTTP_TIMEOUT = 10.0
+
+_client: Optional["httpx.AsyncClient"] = None
+
+
+def get_http_client() -> "httpx.AsyncClient":
+    """
+    Get the process-wide HTTP client, creating it on first use.
+    
+    Reusing one client keeps its connection pool (and TLS sessions) warm
+    across requests instead of handshaking on every call.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        import httpx
+        
+        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,77 +1,94 @@
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 import os
 
+import orjson
+from pythonjsonlogger.jsonlogger import JsonFormatter
+
+
+class OrjsonFormatter(JsonFormatter):
+    """JSON log formatter that serializes records with orjson."""
+    
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        return orjson.dumps(log_record, default=self.json_default or str).decode()
+
+
+# Records are enqueued by loggers and written out by a background listener
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging() -> None:
     """Setup logging configuration.
     
     Configures logging with a JSON formatter and both console and file handlers.
-    Logs are written to `logs/zeitwise.log`.
+    Logs are written to `logs/zeitwise.log`. Loggers only enqueue records; a
+    background listener thread does the console and file I/O.
     """
+    global _log_listener
+    
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    console_handler.setLevel(logging.DEBUG)
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        logs_dir / "zeitwise.log",
+        maxBytes=10485760,  # 10MB
+        backupCount=5,
+    )
+    file_handler.setFormatter(
+        OrjsonFormatter("%(asctime)s %(name)-12s %(levelname)-8s %(message)s")
+    )
+    file_handler.setLevel(logging.INFO)
+    
     log_config = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "json": {
-                "format": "%(asctime)s %(name)-12s %(levelname)-8s %(message)s",
-                "class": "pythonjsonlogger.jsonlogger.JsonFormatter",
-            },
-            "simple": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            },
-        },
         "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "stream": sys.stdout,
-                "formatter": "simple",
-                "level": "DEBUG",
-            },
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "filename": logs_dir / "zeitwise.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-                "formatter": "json",
-                "level": "INFO",
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "queue": _log_queue,
             },
         },
         "loggers": {
             "": {  # root logger
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "level": os.getenv("LOG_LEVEL", "INFO"),
                 "propagate": False,
             },
             "uvicorn": {
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "level": "INFO",
                 "propagate": False,
             },
             "uvicorn.error": {
                 "level": "WARNING",
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "propagate": False,
             },
             "sqlalchemy.engine": {
                 "level": "WARNING",
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "propagate": False,
             },
             "httpx": {
                 "level": "WARNING",
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "propagate": False,
             },
             "httpcore": {
                 "level": "WARNING",
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "propagate": False,
             },
         },
@@ -80,5 +97,22 @@ def setup_logging() -> None:
     # Apply the configuration
     logging.config.dictConfig(log_config)
     
+    # Drain the queue into the real handlers off the calling thread
+    stop_logging()
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    
     # Capture warnings from the warnings module
     logging.captureWarnings(True)
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background log listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
@@ -0,0 +1,31 @@
+"""Shared Redis client."""
+from typing import TYPE_CHECKING, Optional
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+
+_client: Optional["aioredis.Redis"] = None
+
+
+def get_redis_client() -> "aioredis.Redis":
+    """
+    Get the process-wide Redis client, creating it on first use.
+    
+    The client connects lazily, so creating it doesn't touch the network.
+    """
+    global _client
+    if _client is None:
+        import redis.asyncio as aioredis
+        
+        _client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client and its pool, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
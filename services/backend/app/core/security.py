@@ -1,12 +1,21 @@
-from datetime import datetime, timezone
+import asyncio
+import hashlib
+import logging
+import time
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
 import json
-import httpx
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from cachetools import TTLCache
+from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.core.http import get_http_client
+
+logger = logging.getLogger(__name__)
 
 # Security scheme for JWT tokens
 security = HTTPBearer(
@@ -14,16 +23,35 @@ security = HTTPBearer(
     description="Enter JWT Bearer token from Supabase Auth"
 )
 
-# Cache for JWKS
-jwks_cache = {}
+# JWKS cache as (keys by kid, monotonic fetch time). Stale keys keep being
+# served while a single background refresh runs. The key map is read-only and
+# replaced wholesale on refresh, so readers never see a partial update.
+JWKS_TTL_SECONDS = 600
+JWKS_MIN_REFRESH_SECONDS = 30
+# A JWKS with more keys than this is logged as suspicious
+JWKS_MAX_KEYS = 32
+_jwks: Tuple[Mapping[str, Any], float] = (MappingProxyType({}), 0.0)
+_jwks_lock = asyncio.Lock()
+_jwks_refresh: Optional[asyncio.Task] = None
+
+# Verified JWT payloads keyed by token digest, so repeat requests skip the
+# header parse and signature check. Built on first use (see _get_token_cache),
+# so AUTH_CACHE_TTL is read when the app runs rather than at import.
+_token_cache: Optional[TTLCache] = None
 
 # Token validation settings
-TOKEN_ALGORITHMS = ["HS256", "RS256"]
+TOKEN_ALGORITHMS = ["HS256", "RS256", "ES256"]
+# Algorithm of tokens signed with the project's shared JWT secret
+ALGORITHM = "HS256"
+# Single-algorithm allow-lists for jwt.decode, keyed by the JWK's "alg"
+_ALGORITHM_CHOICES = {alg: (alg,) for alg in TOKEN_ALGORITHMS}
 TOKEN_AUDIENCE = "authenticated"
 TOKEN_ISSUER = f"{settings.SUPABASE_URL}/auth/v1" if settings.SUPABASE_URL else None
 
 async def get_jwks() -> Dict[str, Any]:
     """Fetch JWKS from Supabase."""
+    import httpx
+    
     if not settings.SUPABASE_URL:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -33,10 +61,9 @@ async def get_jwks() -> Dict[str, Any]:
     jwks_url = f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json"
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(jwks_url, timeout=10.0)
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().get(jwks_url)
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -48,13 +75,50 @@ async def get_jwks() -> Dict[str, Any]:
             detail=f"Auth service unavailable: {str(e)}"
         )
 
-async def get_public_key(kid: str) -> str:
-    """Get public key for a given key ID from JWKS."""
-    if not jwks_cache:
+async def _refresh_jwks(max_age: float) -> Mapping[str, Any]:
+    """
+    Fetch JWKS and swap in the new keys, single-flight across coroutines.
+    
+    Keys fetched less than ``max_age`` seconds ago are returned as-is, so
+    callers queued on the lock reuse the refresh that just completed.
+    """
+    global _jwks
+    async with _jwks_lock:
+        keys, fetched_at = _jwks
+        if fetched_at and time.monotonic() - fetched_at < max_age:
+            return keys
         jwks = await get_jwks()
-        jwks_cache.update({key['kid']: key for key in jwks.get('keys', [])})
+        keys = MappingProxyType({key['kid']: key for key in jwks.get('keys', [])})
+        if len(keys) > JWKS_MAX_KEYS:
+            # Keep them all: dropping one would reject tokens it signed
+            logger.warning("JWKS has %d keys, more than the expected %d", len(keys), JWKS_MAX_KEYS)
+        _jwks = (keys, time.monotonic())
+        return keys
+
+
+async def _revalidate_jwks() -> None:
+    """Background JWKS refresh; failures keep the stale keys in place."""
+    try:
+        await _refresh_jwks(JWKS_TTL_SECONDS)
+    except HTTPException as e:
+        logger.warning(f"JWKS refresh failed, serving cached keys: {e.detail}")
+
+
+async def get_public_key(kid: str) -> Dict[str, Any]:
+    """Get public key for a given key ID from JWKS."""
+    global _jwks_refresh
+    keys, fetched_at = _jwks
+    if not fetched_at:
+        keys = await _refresh_jwks(JWKS_TTL_SECONDS)
+    elif time.monotonic() - fetched_at >= JWKS_TTL_SECONDS:
+        if _jwks_refresh is None or _jwks_refresh.done():
+            _jwks_refresh = asyncio.create_task(_revalidate_jwks())
     
-    key = jwks_cache.get(kid)
+    key = keys.get(kid)
+    if not key:
+        # The signing key may have rotated; refetch, at most once per interval
+        keys = await _refresh_jwks(JWKS_MIN_REFRESH_SECONDS)
+        key = keys.get(kid)
     if not key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,37 +136,56 @@ def get_token_issuer() -> str:
 
 def verify_token_claims(payload: Dict[str, Any]) -> None:
     """Verify standard JWT claims."""
-    now = datetime.now(timezone.utc)
+    now = time.time()
     
     # Check token expiration
-    if "exp" in payload and datetime.fromtimestamp(payload["exp"], tz=timezone.utc) < now:
+    if payload.get("exp", float("inf")) < now:
         raise JWTError("Token has expired")
         
     # Check not before time
-    if "nbf" in payload and datetime.fromtimestamp(payload["nbf"], tz=timezone.utc) > now:
+    if payload.get("nbf", float("-inf")) > now:
         raise JWTError("Token not yet valid")
     
     # Check audience
-    if "aud" in payload and payload["aud"] != TOKEN_AUDIENCE:
-        raise JWTError(f"Invalid audience: {payload['aud']}")
+    aud = payload.get("aud", TOKEN_AUDIENCE)
+    if aud != TOKEN_AUDIENCE:
+        raise JWTError(f"Invalid audience: {aud}")
     
     # Check issuer if configured
-    if TOKEN_ISSUER and "iss" in payload and payload["iss"] != TOKEN_ISSUER:
-        raise JWTError(f"Invalid issuer: {payload['iss']}")
+    iss = payload.get("iss", TOKEN_ISSUER)
+    if iss != TOKEN_ISSUER and TOKEN_ISSUER is not None:
+        raise JWTError(f"Invalid issuer: {iss}")
 
 
-async def decode_jwt(token: str) -> Dict[str, Any]:
-    """Decode and validate JWT token."""
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="No authentication token provided"
-        )
-        
+async def cached_verify(
+    token: str,
+    verify: Callable[[str], Awaitable[Dict[str, Any]]],
+    cache: Optional[TTLCache],
+) -> Dict[str, Any]:
+    """
+    Verify ``token`` with ``verify``, reusing a payload cached in ``cache``.
+    
+    Payloads are keyed by a digest of the token and never served past their
+    own ``exp`` claim. Failed verifications are not cached; with no cache the
+    token is always verified.
+    """
+    if cache is None:
+        return await verify(token)
+    
+    cache_key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    payload = cache.get(cache_key)
+    if payload is not None and payload.get("exp", float("inf")) > time.time():
+        return payload
+    
+    payload = await verify(token)
+    cache[cache_key] = payload
+    return payload
+
+async def _verify_jwt(token: str) -> Dict[str, Any]:
+    """Verify a Supabase JWT against the project's JWKS."""
     try:
         # Get the JWT header to find the key ID
         header = jwt.get_unverified_header(token)
-        header = jwt.get_unverified_header(token)
         kid = header.get('kid')
         if not kid:
             raise HTTPException(
@@ -112,14 +195,20 @@ async def decode_jwt(token: str) -> Dict[str, Any]:
         
         # Get the public key
         public_key = await get_public_key(kid)
+        algorithms = _ALGORITHM_CHOICES.get(public_key.get('alg'))
+        if algorithms is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token: unsupported algorithm"
+            )
         
         # Decode the token
         payload = jwt.decode(
             token,
             public_key,
-            algorithms=[public_key['alg']],
-            audience='authenticated',
-            issuer=settings.SUPABASE_URL + '/auth/v1',
+            algorithms=algorithms,
+            audience=TOKEN_AUDIENCE,
+            issuer=TOKEN_ISSUER,
             options={"verify_aud": True, "verify_iss": True}
         )
         
@@ -130,6 +219,30 @@ async def decode_jwt(token: str) -> Dict[str, Any]:
             detail=f"Invalid token: {str(e)}"
         )
 
+def _get_token_cache() -> Optional[TTLCache]:
+    """Get the verified-token cache, or None when AUTH_CACHE_TTL disables it."""
+    global _token_cache
+    if settings.AUTH_CACHE_TTL <= 0:
+        return None
+    if _token_cache is None:
+        _token_cache = TTLCache(maxsize=10000, ttl=settings.AUTH_CACHE_TTL)
+    return _token_cache
+
+async def decode_jwt(token: str) -> Dict[str, Any]:
+    """
+    Decode and validate JWT token.
+    
+    Recently verified payloads are reused for ``AUTH_CACHE_TTL`` seconds, but
+    never past their own ``exp`` claim. Failed verifications are not cached.
+    """
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="No authentication token provided"
+        )
+    
+    return await cached_verify(token, _verify_jwt, _get_token_cache())
+
 async def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -192,6 +305,40 @@ async def get_current_user(
         )
 
 
+async def verify_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
+    """
+    Lightweight dependency that only verifies the bearer token.
+    
+    Unlike ``get_current_user`` it doesn't build the user info dict or touch
+    request state, for endpoints that only need an authenticated caller.
+    
+    Returns:
+        The verified JWT payload
+        
+    Raises:
+        HTTPException: If the token is missing or invalid
+    """
+    if not credentials or not credentials.credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    try:
+        payload = await decode_jwt(credentials.credentials)
+        verify_token_claims(payload)
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
 def get_required_roles(*roles: str):
     """
     Dependency factory to require specific roles for an endpoint.
@@ -211,3 +358,32 @@ def get_required_roles(*roles: str):
         return current_user
         
     return role_checker
+
+
+@lru_cache(maxsize=1)
+def _get_pwd_context():
+    """Build the bcrypt hashing context once, on first use."""
+    from passlib.context import CryptContext
+    
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password with bcrypt."""
+    return _get_pwd_context().hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against its bcrypt hash."""
+    return _get_pwd_context().verify(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in the default thread pool.
+    
+    bcrypt spends ~100ms of CPU per hash; running it off the event loop keeps
+    other requests moving while it works.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_password_hash, password)
@@ -1,11 +1,11 @@
 """Base class for SQLAlchemy models."""
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, DateTime, func
 
-Base = declarative_base()
+# Re-exported so every model shares one registry, and one create_all
+from app.models.base import Base
 
 class TimestampMixin:
-    ""
+    """
     Mixin that adds timestamp columns to models.
     """
     created_at = Column(DateTime, default=func.now(), nullable=False)
@@ -1,19 +1,17 @@
 """Database configuration and session management."""
-import os
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
-from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import settings
+from app.db.base import Base
 
 # Create async engine
 DATABASE_URL = settings.DATABASE_URL
 
 # Check if we're in test mode
-if "pytest" in str(os.getpid()):
+if settings.TESTING:
     DATABASE_URL = settings.TEST_DATABASE_URL
     engine = create_async_engine(
         DATABASE_URL,
@@ -30,16 +28,12 @@ else:
     )
 
 # Create async session factory
-async_session_factory = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
+async_session_factory = async_sessionmaker(
+    engine,
     expire_on_commit=False,
     autoflush=False,
 )
 
-# Base class for all models
-Base = declarative_base()
-
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async DB session."""
     async with async_session_factory() as session:
@@ -1,42 +1,39 @@
 """Database dependencies for FastAPI."""
-from typing import AsyncGenerator
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
-from app.db.init_db import get_engine, get_session_maker
 from app.core.config import settings
+from app.db.session import JSON_CODEC, get_db
 
-# Create engine and session maker at startup
-engine = None
-async_session_maker = None
-
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
-    global engine, async_session_maker
-    
-    # Initialize engine and session maker if not already done
-    if engine is None:
-        engine = await get_engine()
-    if async_session_maker is None:
-        async_session_maker = await get_session_maker(engine)
+async def warm_pool(engine: AsyncEngine) -> None:
+    """
+    Open ``DB_POOL_SIZE`` connections up front so early requests don't pay for
+    connection setup (the async pool does not pre-create connections).
+    """
+    async def _checkout() -> None:
+        async with engine.connect():
+            pass
     
-    # Create a new session for each request
-    async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    await asyncio.gather(*(_checkout() for _ in range(settings.DB_POOL_SIZE)))
 
-# Reuse the same session for a single request
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
-    async with get_db() as session:
-        yield session
+@asynccontextmanager
+async def task_session() -> AsyncIterator[AsyncSession]:
+    """
+    Session on a short-lived, unpooled engine, for code run outside a request
+    (e.g. a Celery task under ``asyncio.run``) where the shared engine's pooled
+    connections belong to another event loop.
+    """
+    task_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool, **JSON_CODEC)
+    try:
+        async with AsyncSession(task_engine, expire_on_commit=False, autoflush=False) as session:
+            yield session
+    finally:
+        await task_engine.dispose()
 
 # Use this for type hints
-DatabaseSession = Depends(get_db_session)
+DatabaseSession = Depends(get_db)
@@ -1,104 +1,93 @@
 """Initialize the database with initial data."""
+import asyncio
 import logging
 from typing import Any
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
 
 from app.core.config import settings
+from app.core.security import get_password_hash_async
+from app.db.session import AsyncSessionLocal, async_engine
 from app.models.base import Base
 from app.models.user_model import User
-from app.schemas.user import UserCreate
 
 logger = logging.getLogger(__name__)
 
-async def init_models(engine: AsyncEngine) -> None:
-    """Create database tables."""
-    async with engine.begin() as conn:
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created")
+# Set once tables and initial data are in place
+db_ready = asyncio.Event()
 
-async def get_engine() -> AsyncEngine:
-    """Get database engine."""
-    return create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DEBUG,
-        pool_pre_ping=True,
-        pool_recycle=300,  # Recycle connections after 5 minutes
-    )
+# Advisory lock key that serializes bootstrap across workers starting together
+INIT_DB_LOCK_ID = 0x7A656974
 
-async def get_session_maker(engine: AsyncEngine):
-    """Get async session maker."""
-    return sessionmaker(
-        engine, 
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+def get_engine() -> AsyncEngine:
+    """Get the shared database engine."""
+    return async_engine
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Get the shared async session maker."""
+    return AsyncSessionLocal
 
 async def init_db() -> None:
-    """Initialize database with initial data."""
-    engine = await get_engine()
+    """
+    Initialize database with initial data.
     
-    # Create tables
-    await init_models(engine)
-    
-    # Create session
-    async_session_maker = await get_session_maker(engine)
-    
-    # Create initial data
-    await create_initial_data(async_session_maker)
+    Table creation and the superuser bootstrap share one connection and
+    one transaction.
+    """
+    async with get_engine().begin() as conn:
+        # Held until commit, so concurrent workers don't race on CREATE TABLE
+        await conn.execute(select(func.pg_advisory_xact_lock(INIT_DB_LOCK_ID)))
+        
+        # Create all tables
+        await conn.run_sync(Base.metadata.create_all)
+        logger.info("Database tables created")
+        
+        # Create initial data
+        await create_initial_data(conn)
+
+async def prepare_tables() -> None:
+    """
+    Create tables and initial data, then mark the database ready.
     
-    # Close the engine
-    await engine.dispose()
+    The app runs this in the background at startup; deployments that want
+    eager initialization can await it directly instead.
+    """
+    await init_db()
+    db_ready.set()
 
-async def create_initial_data(async_session_maker) -> None:
+async def create_initial_data(conn: AsyncConnection) -> None:
     """Create initial data in the database."""
-    from app.core.security import get_password_hash
+    if not (settings.FIRST_SUPERUSER_EMAIL and settings.FIRST_SUPERUSER_PASSWORD):
+        return
     
-    # Check if we already have a superuser
-    async with async_session_maker() as session:
-        # Check if users table exists
-        result = await session.execute(
-            text(
-                """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'users'
-                )
-                """
-            )
-        )
-        users_table_exists = result.scalar()
-        
-        if not users_table_exists:
-            logger.info("Users table does not exist, skipping initial data creation")
-            return
-            
-        # Check if we already have a superuser
-        result = await session.execute(
-            select(User).where(User.email == settings.FIRST_SUPERUSER_EMAIL)
+    # Check first so the bcrypt hash is only paid for when inserting, which
+    # after the first deployment is almost never
+    existing = await conn.scalar(
+        select(User.id).where(User.email == settings.FIRST_SUPERUSER_EMAIL)
+    )
+    if existing is not None:
+        logger.info("Superuser already exists, skipping creation")
+        return
+    
+    hashed_password = await get_password_hash_async(settings.FIRST_SUPERUSER_PASSWORD)
+    
+    # ON CONFLICT still covers a row created outside the advisory lock
+    result = await conn.execute(
+        pg_insert(User)
+        .values(
+            email=settings.FIRST_SUPERUSER_EMAIL,
+            hashed_password=hashed_password,
+            full_name="Admin",
+            is_superuser=True,
+            is_verified=True,
+            is_active=True,
         )
-        user = result.scalar_one_or_none()
-        
-        if user is None and settings.FIRST_SUPERUSER_EMAIL and settings.FIRST_SUPERUSER_PASSWORD:
-            logger.info("Creating initial superuser")
-            
-            # Create superuser
-            superuser = User(
-                email=settings.FIRST_SUPERUSER_EMAIL,
-                hashed_password=get_password_hash(settings.FIRST_SUPERUSER_PASSWORD),
-                full_name="Admin",
-                is_superuser=True,
-                is_verified=True,
-                is_active=True,
-            )
-            
-            session.add(superuser)
-            await session.commit()
-            logger.info(f"Created initial superuser: {settings.FIRST_SUPERUSER_EMAIL}")
-        else:
-            logger.info("Superuser already exists, skipping creation")
+        .on_conflict_do_nothing(index_elements=[User.email])
+    )
+    
+    if result.rowcount:
+        logger.info(f"Created initial superuser: {settings.FIRST_SUPERUSER_EMAIL}")
+    else:
+        logger.info("Superuser already exists, skipping creation")
@@ -0,0 +1,101 @@
+"""Batched writes of users' last-login timestamps."""
+import asyncio
+import logging
+from typing import Optional, Set
+from uuid import UUID
+
+from sqlalchemy import bindparam, column, func, table, update
+
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Flush after this many distinct users or this many seconds, whichever is first
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.1
+
+_queue: "asyncio.Queue[UUID]" = asyncio.Queue()
+_task: Optional[asyncio.Task] = None
+
+# The columns written, as a lightweight table rather than the User model, so
+# user_model can import this module without a cycle
+_users = table("users", column("id"), column("last_login_at"))
+
+_record_logins_stmt = (
+    update(_users)
+    .where(_users.c.id.in_(bindparam("ids", expanding=True)))
+    .values(last_login_at=func.now())
+)
+
+
+def _running() -> bool:
+    return _task is not None and not _task.done()
+
+
+async def enqueue(user_id: UUID) -> None:
+    """
+    Queue a login to be recorded with the next batch.
+    
+    Processes that never start the writer (Celery workers, scripts) would
+    never drain the queue, so there the login is written straight away.
+    """
+    if _running():
+        _queue.put_nowait(user_id)
+    else:
+        await _flush({user_id})
+
+
+async def _collect() -> Set[UUID]:
+    """Wait for a login, then gather more until the batch is full or due."""
+    loop = asyncio.get_running_loop()
+    ids = {await _queue.get()}
+    deadline = loop.time() + FLUSH_INTERVAL
+    while len(ids) < BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            ids.add(await asyncio.wait_for(_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return ids
+
+
+async def _flush(ids: Set[UUID]) -> None:
+    """Write one batch with a single UPDATE."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(_record_logins_stmt, {"ids": list(ids)})
+            await session.commit()
+    except Exception:
+        logger.exception(f"Failed to record {len(ids)} user logins")
+
+
+async def _run() -> None:
+    while True:
+        await _flush(await _collect())
+
+
+def start() -> None:
+    """Start the background writer; called from the app lifespan."""
+    global _task
+    if not _running():
+        _task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    """Stop the background writer and flush any logins still queued."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+    
+    ids: Set[UUID] = set()
+    while not _queue.empty():
+        ids.add(_queue.get_nowait())
+    if ids:
+        await _flush(ids)
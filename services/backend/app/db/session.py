@@ -1,51 +1,66 @@
 """
 Database session management.
 """
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from typing import Any, AsyncGenerator, Dict
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+# JSON/JSONB columns are encoded and decoded with orjson
+JSON_CODEC: Dict[str, Any] = {
+    "json_serializer": _json_dumps,
+    "json_deserializer": orjson.loads,
+}
+
+# One async engine, and so one connection pool, per process
 if settings.TESTING:
-    # Use in-memory SQLite for tests
-    SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+    # Tests run each case on a fresh event loop; don't pool across loops
+    async_engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        poolclass=NullPool,
+        **JSON_CODEC,
     )
 else:
-    SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
+    async_engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
         pool_pre_ping=True,
-        pool_recycle=300,  # Recycle connections after 5 minutes
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        **JSON_CODEC,
     )
 
 # Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
 )
 
-# Base class for models
-Base = declarative_base()
-
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function that yields database sessions.
     
     Yields:
-        Session: A database session
+        AsyncSession: A database session, committed when the request succeeds
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -1,18 +1,27 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import AsyncEngine
 from typing import AsyncGenerator, Dict, Any
+import asyncio
 import logging
 import os
 import time
 
 from .core.config import settings
+from .core.http import close_http_client, get_http_client
+from .core.logging import stop_logging
+from .core.redis import close_redis_client, get_redis_client
 from .core.security import get_current_user
+from .db import login_writer
+from .db.deps import warm_pool
+from .db.init_db import db_ready, prepare_tables
+from .db.session import AsyncSessionLocal, async_engine
 from .schemas.responses import HealthCheckResponse, HealthStatus
 
 # Import routers
-from .routes import api_router
+from .routes import register_all
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,18 +36,50 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize resources (database connections, etc.)
     # await database.connect()
     
+    # The database engine and session factory are created once per process
+    app.state.engine = async_engine
+    app.state.sessionmaker = AsyncSessionLocal
+    
     # Initialize services
     await initialize_services()
     
+    # Shared outbound HTTP client (JWKS fetches, etc.)
+    app.state.http = get_http_client()
+    
+    # Shared Redis client (meme task records); connects on first command
+    app.state.redis = get_redis_client()
+    
+    # Create tables and warm the pool in the background so liveness checks
+    # answer immediately; /healthz reports not-ready until the tables exist
+    app.state.db_init = asyncio.create_task(prepare_database(app.state.engine))
+    
+    # Batch last-login writes in the background
+    login_writer.start()
+    
     yield  # The application runs here
     
     # Shutdown
     logger.info("Shutting down...")
+    app.state.db_init.cancel()
+    await login_writer.stop()
+    await close_http_client()
+    await close_redis_client()
+    await app.state.engine.dispose()
+    stop_logging()
     # await database.disconnect()
 
+async def prepare_database(engine: AsyncEngine) -> None:
+    """Run database initialization, logging rather than raising on failure."""
+    try:
+        await prepare_tables()
+        # Pre-open pooled database connections
+        await warm_pool(engine)
+    except Exception:
+        logger.exception("Database initialization failed")
+
 async def initialize_services() -> None:
     """Initialize application services."""
-    # TODO: Initialize database connections, caches, etc.
+    # TODO: Initialize caches, etc.
     pass
 
 # Create FastAPI application
@@ -49,20 +90,21 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Set up CORS middleware (always add it, but only allow origins if configured)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS if settings.BACKEND_CORS_ORIGINS else [],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Include API router with /api prefix
-app.include_router(api_router, prefix="/api")
+# Include API routers with /api prefix
+register_all(app)
 
 # Custom exception handler
 async def http_exception_handler(request, exc):
@@ -95,9 +137,14 @@ async def ping() -> HealthCheckResponse:
 
 # Simple health check for load balancers
 @app.get("/healthz", include_in_schema=False)
-async def healthz() -> Dict[str, str]:
-    """Health check endpoint for load balancers."""
-    return {"status": "ok"}
+async def healthz() -> Response:
+    """Readiness check for load balancers; 503 until the database is initialized."""
+    if not db_ready.is_set():
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"},
+        )
+    return ORJSONResponse({"status": "ok"})
 
 def main():
     """
@@ -106,11 +153,21 @@ def main():
     """
     import uvicorn
     
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    reload = os.environ.get("UVICORN_RELOAD", "0") == "1"
+    if reload and workers > 1:
+        # Uvicorn can't reload a multi-process server
+        logger.warning("UVICORN_RELOAD is set; ignoring WEB_CONCURRENCY=%d", workers)
+        workers = 1
+    
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        reload=reload,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
 
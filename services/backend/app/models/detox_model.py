@@ -1,35 +1,49 @@
 """Database models for detox pipeline."""
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Column, String, Boolean, Float, JSON, DateTime, Text
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, Boolean, Float, DateTime, Index, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.sql import func
 
-Base = declarative_base()
+from app.models.base import Base, uuid7
 
 class DetoxItem(Base):
     """Model for storing detox analysis results."""
     __tablename__ = "detox_items"
     
-    id = Column(PGUUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
+    id = Column(PGUUID(as_uuid=True), primary_key=True, index=True, default=uuid7)
+    user_id = Column(PGUUID(as_uuid=True), nullable=True)  # Owner of the item
+    status = Column(String(20), nullable=False, default="pending")  # pending/completed/error
     original_text = Column(Text, nullable=False)
-    analysis = Column(Text, nullable=False)
+    analysis = Column(Text, nullable=True)  # Filled in once processing completes
     is_sensational = Column(Boolean, default=False, index=True)
     confidence = Column(Float, default=0.0)
-    entities = Column(JSON, default=list)  # List of dicts with entity info
-    similar_items = Column(JSON, default=list)  # List of similar items from Qdrant
+    entities = Column(JSONB, server_default=text("'[]'::jsonb"))  # List of dicts with entity info
+    similar_items = Column(JSONB, server_default=text("'[]'::jsonb"))  # List of similar items from Qdrant
     meme_task_id = Column(String, nullable=True, index=True)  # Celery task ID for meme generation
-    metadata = Column(JSON, default=dict)  # Additional metadata
+    # "metadata" is reserved by the Declarative API, so the attribute is renamed
+    metadata_ = Column("metadata", JSONB, server_default=text("'{}'::jsonb"))  # Additional metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    __table_args__ = (
+        # Serves "a user's items, newest first" as an index range scan
+        Index(
+            "ix_detox_items_user_created",
+            user_id,
+            created_at.desc(),
+            postgresql_include=["status"],
+        ),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         return {
             "id": str(self.id),
+            "user_id": str(self.user_id) if self.user_id else None,
+            "status": self.status,
             "original_text": self.original_text,
             "analysis": self.analysis,
             "is_sensational": self.is_sensational,
@@ -37,7 +51,7 @@ class DetoxItem(Base):
             "entities": self.entities or [],
             "similar_items": self.similar_items or [],
             "meme_task_id": self.meme_task_id,
-            "metadata": self.metadata or {},
+            "metadata": self.metadata_ or {},
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
@@ -45,14 +59,18 @@ class DetoxItem(Base):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DetoxItem':
         """Create model instance from dictionary."""
-        return cls(
-            id=data.get("id", uuid4()),
-            original_text=data["original_text"],
-            analysis=data.get("analysis", ""),
-            is_sensational=data.get("is_sensational", False),
-            confidence=data.get("confidence", 0.0),
-            entities=data.get("entities", []),
-            similar_items=data.get("similar_items", []),
-            meme_task_id=data.get("meme_task_id"),
-            metadata=data.get("metadata", {})
-        )
+        kwargs = {
+            "id": data.get("id") or uuid7(),
+            "original_text": data["original_text"],
+            "analysis": data.get("analysis", ""),
+            "is_sensational": data.get("is_sensational", False),
+            "confidence": data.get("confidence", 0.0),
+            "meme_task_id": data.get("meme_task_id"),
+        }
+        # Empty JSON columns are left to their server defaults
+        for key in ("entities", "similar_items"):
+            if data.get(key):
+                kwargs[key] = data[key]
+        if data.get("metadata"):
+            kwargs["metadata_"] = data["metadata"]
+        return cls(**kwargs)
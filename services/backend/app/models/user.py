@@ -7,8 +7,10 @@ from pydantic import BaseModel, EmailStr, Field, validator
 from pydantic.types import constr
 from uuid import UUID, uuid4
 
-# Password constraints
-PasswordStr = constr(min_length=8, max_length=100, regex=r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d).*$")
+# Password constraints; the character-class rules are enforced by
+# UserCreate.validate_password_strength, as pydantic v2 patterns have no
+# look-ahead
+PasswordStr = constr(min_length=8, max_length=100)
 
 class UserBase(BaseModel):
     """Base user model with common fields."""
@@ -11,15 +11,19 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    bindparam,
     func,
     select,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, mapped_column, relationship, sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.expression import text
 
 from app.core.config import settings
+from app.core.security import get_password_hash_async
+from app.db import login_writer
 from app.models.base import Base
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -101,7 +105,7 @@ class User(Base):
         "metadata",
         JSONB,
         nullable=False,
-        server_default="{}",
+        server_default=text("'{}'::jsonb"),
         comment="Additional user metadata as JSON"
     )
     
@@ -115,13 +119,13 @@ class User(Base):
     @classmethod
     async def get_by_email(cls, db: AsyncSession, email: str) -> Optional["User"]:
         """Get a user by email."""
-        result = await db.execute(select(cls).where(cls.email == email))
+        result = await db.execute(_get_by_email_stmt, {"email": email})
         return result.scalar_one_or_none()
     
     @classmethod
     async def get_by_id(cls, db: AsyncSession, user_id: UUID) -> Optional["User"]:
         """Get a user by ID."""
-        result = await db.execute(select(cls).where(cls.id == user_id))
+        result = await db.execute(_get_by_id_stmt, {"user_id": user_id})
         return result.scalar_one_or_none()
     
     @classmethod
@@ -133,11 +137,9 @@ class User(Base):
         is_verified: bool = False,
     ) -> "User":
         """Create a new user."""
-        from app.core.security import get_password_hash
-        
-        db_user = cls(
+        kwargs = dict(
             email=user_in.email,
-            hashed_password=get_password_hash(user_in.password) if user_in.password else None,
+            hashed_password=await get_password_hash_async(user_in.password) if user_in.password else None,
             full_name=user_in.full_name,
             avatar_url=user_in.avatar_url,
             timezone=user_in.timezone or "UTC",
@@ -145,8 +147,11 @@ class User(Base):
             is_active=user_in.is_active if user_in.is_active is not None else True,
             is_verified=is_verified or user_in.is_verified or False,
             is_superuser=is_superuser,
-            metadata_=user_in.metadata_ or {},
         )
+        # Without metadata the column's server default fills in the empty object
+        if user_in.metadata_:
+            kwargs["metadata_"] = user_in.metadata_
+        db_user = cls(**kwargs)
         
         db.add(db_user)
         await db.commit()
@@ -159,13 +164,11 @@ class User(Base):
         user_in: UserUpdate,
     ) -> "User":
         """Update user data."""
-        from app.core.security import get_password_hash
-        
         update_data = user_in.dict(exclude_unset=True)
         
         # Handle password update
         if "password" in update_data:
-            self.hashed_password = get_password_hash(update_data["password"])
+            self.hashed_password = await get_password_hash_async(update_data["password"])
         
         # Update other fields
         for field, value in update_data.items():
@@ -186,10 +189,14 @@ class User(Base):
         return True
     
     async def record_login(self, db: AsyncSession) -> None:
-        """Record the user's login time."""
-        self.last_login_at = datetime.utcnow()
-        db.add(self)
-        await db.commit()
+        """
+        Record the user's login time.
+        
+        The database write is batched with other logins in the background;
+        this instance is updated immediately without being marked dirty.
+        """
+        set_committed_value(self, "last_login_at", datetime.utcnow())
+        await login_writer.enqueue(self.id)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert user to dictionary."""
@@ -208,3 +215,8 @@ class User(Base):
             "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
             "metadata": self.metadata_,
         }
+
+
+# Lookup statements are built once; each call only binds parameters
+_get_by_email_stmt = select(User).where(User.email == bindparam("email"))
+_get_by_id_stmt = select(User).where(User.id == bindparam("user_id"))
@@ -1,49 +1,58 @@
 # This file makes the routes directory a Python package
-import logging
-from fastapi import APIRouter
-
-# Set up logging
-logger = logging.getLogger(__name__)
-
-# Create a main router to include all other routers
-api_router = APIRouter()
-
-try:
-    # Import and include all routers
-    logger.info("Importing auth router...")
-    from . import auth
-    logger.info("Importing chat router...")
-    from . import chat
-    logger.info("Importing detox router...")
-    from . import detox
-    logger.info("Importing integrations router...")
-    from . import integrations
-    logger.info("Importing verification router...")
-    from . import verification
-    logger.info("Importing memes router...")
-    from . import memes
-    
-    # Include all routers with their prefixes
-    logger.info("Including auth router at /auth")
-    api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-    logger.info("Including verification router at /verification")
-    api_router.include_router(verification.router, prefix="/verification", tags=["Verification"])
-    logger.info("Including memes router at /memes")
-    api_router.include_router(memes.router, prefix="/memes", tags=["Memes"])
-    logger.info("Including chat router at /chat")
-    api_router.include_router(chat.router, prefix="/chat", tags=["Chat"])
-    logger.info("Including detox router at /detox")
-    api_router.include_router(detox.router, prefix="/detox", tags=["Detox"])
-    logger.info("Including integrations router at /")
-    api_router.include_router(integrations.router, prefix="", tags=["Integrations"])
-    
-    # Log all registered routes
-    for route in api_router.routes:
-        logger.info(f"Registered route: {route.path} - {', '.join(route.methods)}")
+import importlib
+from typing import Any, Union
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import settings
+
+# Route module -> (prefix, tags) it is mounted with
+_ROUTERS = {
+    "auth": ("/auth", ["Authentication"]),
+    "verification": ("/verification", ["Verification"]),
+    "memes": ("/memes", ["Memes"]),
+    "chat": ("/chat", ["Chat"]),
+    "detox": ("", ["Detox"]),
+    "integrations": ("", ["Integrations"]),
+}
+
+# Routers only mounted when named in settings.FEATURES
+_OPTIONAL_ROUTERS = frozenset({"auth", "verification", "memes"})
+
+
+def register_all(app: Union[FastAPI, APIRouter], prefix: str = "/api") -> None:
+    """
+    Import every enabled route module and include its router in ``app``.
     
-except Exception as e:
-    logger.error(f"Error setting up routes: {e}", exc_info=True)
-    raise
+    Including the routers straight into the app, rather than through
+    ``api_router``, builds each route once instead of copying it twice.
+    """
+    for name, (router_prefix, tags) in _ROUTERS.items():
+        if name in _OPTIONAL_ROUTERS and name not in settings.FEATURE_SET:
+            continue
+        module = importlib.import_module(f".{name}", __name__)
+        app.include_router(module.router, prefix=prefix + router_prefix, tags=tags)
+
+
+def _build_api_router() -> APIRouter:
+    """Build a router combining every route module, without the /api prefix."""
+    # Matches the app's default, for apps that mount this router on their own
+    api_router = APIRouter(default_response_class=ORJSONResponse)
+    register_all(api_router, prefix="")
+    return api_router
+
+
+def __getattr__(name: str) -> Any:
+    # Import route modules on first use, so pulling in one of them (as the
+    # tests do) doesn't load every router's services
+    if name == "api_router":
+        globals()[name] = api_router = _build_api_router()
+        return api_router
+    if name in _ROUTERS:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Make all routers available for direct import
-__all__ = ["api_router", "auth", "verification", "memes", "chat", "detox", "integrations"]
+__all__ = ["api_router", "register_all", *_ROUTERS]
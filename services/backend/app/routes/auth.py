@@ -5,16 +5,56 @@ from typing import Optional, Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, HttpUrl
 
 from app.services.supabase_auth import supabase_auth_service, get_current_active_user
 from app.services.auth_service import oauth2_scheme  # Keep for backward compatibility
+from app.core.config import settings
+from app.core.errors import safe_endpoint
 from app.core.security import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-# Request and Response Models
+# Set-Cookie headers that expire both session cookies, rendered once
+_CLEAR_AUTH_COOKIES = tuple(
+    (
+        b"set-cookie",
+        f'{name}=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; Max-Age=0; '
+        f"Path=/; HttpOnly; SameSite=lax".encode("latin-1"),
+    )
+    for name in (settings.SUPABASE_AUTH_COOKIE_NAME, settings.SUPABASE_REFRESH_COOKIE_NAME)
+)
+
+
+def _set_auth_cookies(
+    response: Optional[Response],
+    access_token: Optional[str],
+    refresh_token: Optional[str] = None,
+) -> None:
+    """Set the session cookies; the refresh cookie only when a token is given."""
+    if response is None:
+        return
+    response.set_cookie(
+        key=settings.SUPABASE_AUTH_COOKIE_NAME,
+        value=access_token or "",
+        httponly=True,
+        max_age=settings.SUPABASE_TOKEN_EXPIRY,
+        samesite="lax"
+    )
+    if refresh_token is not None:
+        response.set_cookie(
+            key=settings.SUPABASE_REFRESH_COOKIE_NAME,
+            value=refresh_token,
+            httponly=True,
+            max_age=settings.SUPABASE_REFRESH_TOKEN_EXPIRY,
+            samesite="lax"
+        )
+
+# Request and Response Models. Token and UserResponse aren't used by any
+# route yet, so their validators are only built if something uses them.
 class Token(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -26,6 +66,8 @@ class UserCreate(BaseModel):
     user_metadata: Optional[Dict[str, Any]] = None
     
 class UserResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     id: str
     email: str
     email_verified: bool
@@ -49,6 +91,7 @@ class OAuthRequest(BaseModel):
     redirect_uri: str
 
 @router.post("/login", response_model=Dict[str, Any])
+@safe_endpoint("An error occurred during login")
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     response: Response = None
@@ -59,50 +102,31 @@ async def login(
     This endpoint authenticates a user with their email and password and returns
     an access token and refresh token.
     """
-    try:
-        # Authenticate with Supabase
-        result = await supabase_auth_service.sign_in_with_email_password(
-            email=form_data.username,
-            password=form_data.password
-        )
-        
-        # Get the session data
-        session = result.get("data", {})
-        user = session.get("user", {})
-        
-        # Set the auth cookie if needed
-        if response and hasattr(response, 'set_cookie'):
-            response.set_cookie(
-                key="sb-access-token",
-                value=session.get("access_token", ""),
-                httponly=True,
-                max_age=3600,  # 1 hour
-                samesite="lax"
-            )
-            response.set_cookie(
-                key="sb-refresh-token",
-                value=session.get("refresh_token", ""),
-                httponly=True,
-                max_age=604800,  # 7 days
-                samesite="lax"
-            )
-        
-        return {
-            "access_token": session.get("access_token"),
-            "refresh_token": session.get("refresh_token"),
-            "expires_in": session.get("expires_in"),
-            "token_type": "bearer",
-            "user": user
-        }
-    except HTTPException as http_exc:
-        raise http_exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred during login"
-        ) from exc
+    # Authenticate with Supabase
+    result = await supabase_auth_service.sign_in_with_email_password(
+        email=form_data.username,
+        password=form_data.password
+    )
+    
+    # Get the session data
+    session = result.get("data", {})
+    user = session.get("user", {})
+    
+    # Set the auth cookies
+    _set_auth_cookies(
+        response, session.get("access_token", ""), session.get("refresh_token", "")
+    )
+    
+    return {
+        "access_token": session.get("access_token"),
+        "refresh_token": session.get("refresh_token"),
+        "expires_in": session.get("expires_in"),
+        "token_type": "bearer",
+        "user": user
+    }
 
 @router.post("/signup", response_model=Dict[str, Any])
+@safe_endpoint("An error occurred during signup")
 async def signup(
     user_data: UserCreate,
     response: Response = None
@@ -113,49 +137,29 @@ async def signup(
     This endpoint creates a new user account and returns an access token
     and refresh token for the new user.
     """
-    try:
-        # Create user in Supabase Auth
-        result = await supabase_auth_service.sign_up_with_email_password(
-            email=user_data.email,
-            password=user_data.password,
-            user_metadata=user_data.user_metadata
-        )
-        
-        # Get the session data
-        session = result.get("data", {})
-        user = session.get("user", {})
-        
-        # Set the auth cookie if needed
-        if response and hasattr(response, 'set_cookie'):
-            response.set_cookie(
-                key="sb-access-token",
-                value=session.get("access_token", ""),
-                httponly=True,
-                max_age=3600,  # 1 hour
-                samesite="lax"
-            )
-            response.set_cookie(
-                key="sb-refresh-token",
-                value=session.get("refresh_token", ""),
-                httponly=True,
-                max_age=604800,  # 7 days
-                samesite="lax"
-            )
-        
-        return {
-            "access_token": session.get("access_token"),
-            "refresh_token": session.get("refresh_token"),
-            "expires_in": session.get("expires_in"),
-            "token_type": "bearer",
-            "user": user
-        }
-    except HTTPException as http_exc:
-        raise http_exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred during signup"
-        ) from exc
+    # Create user in Supabase Auth
+    result = await supabase_auth_service.sign_up_with_email_password(
+        email=user_data.email,
+        password=user_data.password,
+        user_metadata=user_data.user_metadata
+    )
+    
+    # Get the session data
+    session = result.get("data", {})
+    user = session.get("user", {})
+    
+    # Set the auth cookies
+    _set_auth_cookies(
+        response, session.get("access_token", ""), session.get("refresh_token", "")
+    )
+    
+    return {
+        "access_token": session.get("access_token"),
+        "refresh_token": session.get("refresh_token"),
+        "expires_in": session.get("expires_in"),
+        "token_type": "bearer",
+        "user": user
+    }
 
 @router.post("/otp/request")
 async def request_phone_otp(request: PhoneOTPLoginRequest):
@@ -178,6 +182,7 @@ async def request_phone_otp(request: PhoneOTPLoginRequest):
         )
 
 @router.post("/otp/verify")
+@safe_endpoint("An error occurred during OTP verification")
 async def verify_phone_otp(
     request: VerifyOTPRequest,
     response: Response = None
@@ -187,60 +192,30 @@ async def verify_phone_otp(
     
     Verifies the one-time password and authenticates the user if valid.
     """
-    try:
-        # This would integrate with Supabase's phone auth
-        # For now, we'll just return a mock response
-        mock_user = {
-            "id": "phone-auth-user-id",
-            "phone": request.phone,
-            "role": "authenticated",
-            "aud": "authenticated",
-            "app_metadata": {
-                "provider": "phone"
-            },
-            "user_metadata": {}
-        }
-        
-        # In a real implementation, we would get this from Supabase
-        mock_session = {
-            "access_token": "mock-access-token",
-            "refresh_token": "mock-refresh-token",
-            "expires_in": 3600,
-            "token_type": "bearer",
-            "user": mock_user
-        }
-        
-        # Set the auth cookie if needed
-        if response and hasattr(response, 'set_cookie'):
-            response.set_cookie(
-                key="sb-access-token",
-                value=mock_session["access_token"],
-                httponly=True,
-                max_age=3600,  # 1 hour
-                samesite="lax"
-            )
-            response.set_cookie(
-                key="sb-refresh-token",
-                value=mock_session["refresh_token"],
-                httponly=True,
-                max_age=604800,  # 7 days
-                samesite="lax"
-            )
-        
-        return {
-            "access_token": mock_session["access_token"],
-            "refresh_token": mock_session["refresh_token"],
-            "expires_in": mock_session["expires_in"],
-            "token_type": "bearer",
-            "user": mock_user
-        }
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred during OTP verification"
-        ) from exc
+    # This would integrate with Supabase's phone auth
+    # For now, we'll just return a mock response
+    mock_user = {
+        "id": "phone-auth-user-id",
+        "phone": request.phone,
+        "role": "authenticated",
+        "aud": "authenticated",
+        "app_metadata": {"provider": "phone"},
+        "user_metadata": {}
+    }
+    
+    # In a real implementation, we would get the session from Supabase
+    _set_auth_cookies(response, "mock-access-token", "mock-refresh-token")
+    
+    return {
+        "access_token": "mock-access-token",
+        "refresh_token": "mock-refresh-token",
+        "expires_in": 3600,
+        "token_type": "bearer",
+        "user": mock_user
+    }
 
 @router.get("/oauth/{provider}")
+@safe_endpoint("An error occurred during {provider} login")
 async def login_with_oauth(
     provider: str,
     code: str,
@@ -253,51 +228,32 @@ async def login_with_oauth(
     This endpoint handles the OAuth callback and exchanges the authorization code
     for an access token.
     """
-    try:
-        # Exchange the authorization code for tokens
-        result = await supabase_auth_service.sign_in_with_oauth(
-            provider=provider,
-            code=code,
-            redirect_uri=redirect_uri
-        )
-        
-        # Get the session data
-        session = result.get("data", {})
-        user = session.get("user", {})
-        
-        # Set the auth cookie if needed
-        if response and hasattr(response, 'set_cookie'):
-            response.set_cookie(
-                key="sb-access-token",
-                value=session.get("access_token", ""),
-                httponly=True,
-                max_age=3600,  # 1 hour
-                samesite="lax"
-            )
-            response.set_cookie(
-                key="sb-refresh-token",
-                value=session.get("refresh_token", ""),
-                httponly=True,
-                max_age=604800,  # 7 days
-                samesite="lax"
-            )
-        
-        return {
-            "access_token": session.get("access_token"),
-            "refresh_token": session.get("refresh_token"),
-            "expires_in": session.get("expires_in"),
-            "token_type": "bearer",
-            "user": user
-        }
-    except HTTPException as http_exc:
-        raise http_exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An error occurred during {provider} login"
-        ) from exc
+    # Exchange the authorization code for tokens
+    result = await supabase_auth_service.sign_in_with_oauth(
+        provider=provider,
+        code=code,
+        redirect_uri=redirect_uri
+    )
+    
+    # Get the session data
+    session = result.get("data", {})
+    user = session.get("user", {})
+    
+    # Set the auth cookies
+    _set_auth_cookies(
+        response, session.get("access_token", ""), session.get("refresh_token", "")
+    )
+    
+    return {
+        "access_token": session.get("access_token"),
+        "refresh_token": session.get("refresh_token"),
+        "expires_in": session.get("expires_in"),
+        "token_type": "bearer",
+        "user": user
+    }
 
 @router.get("/me", response_model=Dict[str, Any])
+@safe_endpoint("Could not retrieve user information")
 async def get_current_user_info(
     request: Request,
     current_user: Dict[str, Any] = Depends(get_current_active_user)
@@ -308,17 +264,10 @@ async def get_current_user_info(
     Returns detailed information about the currently authenticated user,
     including their profile data and metadata.
     """
-    try:
-        return await supabase_auth_service.get_current_user_info(request)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Could not retrieve user information"
-        )
+    return await supabase_auth_service.get_current_user_info(request)
 
 @router.post("/logout")
+@safe_endpoint("Could not log out")
 async def logout(
     response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user)
@@ -328,22 +277,16 @@ async def logout(
     
     This endpoint invalidates the current session and clears auth cookies.
     """
-    try:
-        # Clear the auth cookies
-        response.delete_cookie("sb-access-token")
-        response.delete_cookie("sb-refresh-token")
-        
-        # In a real implementation, you might want to revoke the refresh token
-        # await supabase_auth_service.sign_out(current_user.get("access_token"))
-        
-        return {"message": "Successfully logged out"}
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Could not log out"
-        )
+    # Clear the auth cookies
+    response.raw_headers.extend(_CLEAR_AUTH_COOKIES)
+    
+    # In a real implementation, you might want to revoke the refresh token
+    # await supabase_auth_service.sign_out(current_user.get("access_token"))
+    
+    return {"message": "Successfully logged out"}
 
 @router.post("/refresh")
+@safe_endpoint("Could not refresh session", status.HTTP_401_UNAUTHORIZED)
 async def refresh_session(
     refresh_token: str,
     response: Response = None
@@ -353,39 +296,14 @@ async def refresh_session(
     
     This endpoint exchanges a refresh token for a new access token.
     """
-    try:
-        result = await supabase_auth_service.refresh_session(refresh_token)
-        
-        # Update the auth cookies if response is provided
-        if response and hasattr(response, 'set_cookie'):
-            response.set_cookie(
-                key="sb-access-token",
-                value=result.get("access_token"),
-                httponly=True,
-                max_age=3600,  # 1 hour
-                samesite="lax"
-            )
-            
-            # Only update refresh token if a new one was provided
-            if "refresh_token" in result:
-                response.set_cookie(
-                    key="sb-refresh-token",
-                    value=result["refresh_token"],
-                    httponly=True,
-                    max_age=604800,  # 7 days
-                    samesite="lax"
-                )
-        
-        return {
-            "access_token": result.get("access_token"),
-            "refresh_token": result.get("refresh_token"),
-            "token_type": "bearer",
-            "expires_in": result.get("expires_in")
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not refresh session"
-        )
+    result = await supabase_auth_service.refresh_session(refresh_token)
+    
+    # Update the auth cookies; the refresh token only if a new one was provided
+    _set_auth_cookies(response, result.get("access_token"), result.get("refresh_token"))
+    
+    return {
+        "access_token": result.get("access_token"),
+        "refresh_token": result.get("refresh_token"),
+        "token_type": "bearer",
+        "expires_in": result.get("expires_in")
+    }
@@ -1,29 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Any
-import uuid
-from datetime import datetime
+import asyncio
 import logging
 
 from app.schemas.requests import ChatRequest, Message
-from app.schemas.responses import ChatResponse, ChatMessageResponse
-from app.core.security import get_current_user
+from app.schemas.responses import ChatResponse
+from app.core.errors import safe_endpoint
+from app.core.routing import ORJSONRoute
+from app.core.security import get_current_user, verify_token
 from app.services.chat_service import chat_service
 
 logger = logging.getLogger(__name__)
 
+# Characters per SSE event; large enough that each write fills a TCP segment
+STREAM_CHUNK_SIZE = 1024
+
+# Chat bodies carry the whole message history, so parse them with orjson
 router = APIRouter(
+    route_class=ORJSONRoute,
     prefix="",  # No prefix here since it's added in routes/__init__.py
     tags=["chat"],
-    dependencies=[Depends(get_current_user)],
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("", response_model=ChatResponse)
+# Handlers return plain dicts shaped like ChatResponse; the model only
+# documents the schema, so responses skip a validation pass
+@router.post("", response_model=None, responses={200: {"model": ChatResponse}})
+@safe_endpoint("An error occurred while processing your request")
 async def chat_endpoint(
     chat_request: ChatRequest, 
     user: Dict[str, Any] = Depends(get_current_user)
-) -> ChatResponse:
+) -> Dict[str, Any]:
     """
     Chat with a persona.
     
@@ -37,28 +45,20 @@ async def chat_endpoint(
     Returns:
         ChatResponse containing the assistant's response
     """
-    try:
-        logger.info(f"Processing chat request for user: {user.get('email')}")
-        
-        # Call the chat service
-        response = await chat_service.chat(chat_request, user)
-        
-        # Convert the response to a ChatResponse model
-        return ChatResponse(
-            message=response["message"],
-            conversation_id=response["conversation_id"],
-            usage=response.get("usage", {}),
-            finish_reason=response.get("finish_reason", "stop")
-        )
-    except Exception as e:
-        logger.error(f"Error processing chat request: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while processing your request"
-        )
+    logger.info("Processing chat request for user: %s", user.get("email"))
+    
+    # Call the chat service
+    response = await chat_service.chat(chat_request, user)
+    
+    return {
+        "message": response["message"],
+        "conversation_id": response["conversation_id"],
+        "usage": response.get("usage", {}),
+        "finish_reason": response.get("finish_reason", "stop"),
+    }
 
 @router.post("/stream")
-async def chat_stream(chat_request: ChatRequest, user: dict = Depends(get_current_user)):
+async def chat_stream(chat_request: ChatRequest, token: dict = Depends(verify_token)):
     """
     Stream chat responses.
     
@@ -70,11 +70,11 @@ async def chat_stream(chat_request: ChatRequest, user: dict = Depends(get_curren
     async def generate():
         # Simulate streaming response
         response_text = f"Streaming response to: {chat_request.messages[-1].content}"
-        for i in range(0, len(response_text), 5):
-            chunk = response_text[i:i+5]
+        for i in range(0, len(response_text), STREAM_CHUNK_SIZE):
+            chunk = response_text[i:i + STREAM_CHUNK_SIZE]
             yield f"data: {chunk}\n\n"
-            import asyncio
-            await asyncio.sleep(0.1)
+            # Yield to the event loop between chunks without delaying them
+            await asyncio.sleep(0)
         yield "data: [DONE]\n\n"
 
     return StreamingResponse(
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import Any, Dict, List, Optional, Tuple
+import time
 import uuid
-from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.requests import DetoxRequest, DetoxContentType
-from app.schemas.responses import DetoxResponse, HistoricalParallel, AnalysisResult, MemeImage
+from app.schemas.responses import DetoxResponse
 from app.core.security import get_current_user
+from app.db.deps import get_db
+from app.models.detox_model import DetoxItem
 
 router = APIRouter(
     prefix="/detox",
@@ -14,7 +19,48 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("", response_model=DetoxResponse)
+# Placeholder detox results, built once and shared by every response.
+# They're only ever serialized, never mutated.
+_MOCK_HISTORICAL_PARALLELS = [
+    {
+        "event": "Tulip Mania",
+        "year": 1637,
+        "similarity": 0.85,
+        "description": "A period in the Dutch Golden Age during which contract prices for some bulbs of the recently introduced tulip reached extraordinarily high levels and then dramatically collapsed.",
+        "source": "https://en.wikipedia.org/wiki/Tulip_mania",
+    }
+]
+_MOCK_ANALYSIS = {
+    "summary": "This content appears to be sensationalist and may cause unnecessary panic.",
+    "key_points": [
+        "The language used is emotionally charged",
+        "Historical context can provide perspective",
+        "Consider multiple sources before drawing conclusions"
+    ],
+    "sentiment": -0.7,
+    "tags": ["finance", "market", "volatility"],
+}
+_MOCK_MEME = {
+    "url": None,
+    "text": "When you panic sell and the market recovers",
+    "style": "frustrated-trader",
+}
+
+# (Unix second, ISO 8601 string) of the last timestamp formatted
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time in ISO 8601, formatted at most once per second."""
+    global _iso_cache
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _iso_cache[1]
+
+# Returns a plain dict shaped like DetoxResponse; the model only documents
+# the schema, so the response skips a validation pass
+@router.post("", response_model=None, responses={200: {"model": DetoxResponse}})
 async def detox_content(detox_request: DetoxRequest, user: dict = Depends(get_current_user)):
     """
     Process content through the Doomscroll Detox pipeline.
@@ -25,64 +71,93 @@ async def detox_content(detox_request: DetoxRequest, user: dict = Depends(get_cu
     # TODO: Implement actual detox logic
     # This is a placeholder implementation
     
-    # Mock historical parallels
-    historical_parallels = None
-    if detox_request.include_historical_parallels:
-        historical_parallels = [
-            HistoricalParallel(
-                event="Tulip Mania",
-                year=1637,
-                similarity=0.85,
-                description="A period in the Dutch Golden Age during which contract prices for some bulbs of the recently introduced tulip reached extraordinarily high levels and then dramatically collapsed.",
-                source="https://en.wikipedia.org/wiki/Tulip_mania"
-            )
-        ]
+    historical_parallels = _MOCK_HISTORICAL_PARALLELS if detox_request.include_historical_parallels else None
+    analysis = _MOCK_ANALYSIS if detox_request.include_analysis else None
+    meme = _MOCK_MEME if detox_request.include_meme else None
     
-    # Mock analysis
-    analysis = None
-    if detox_request.include_analysis:
-        analysis = AnalysisResult(
-            summary="This content appears to be sensationalist and may cause unnecessary panic.",
-            key_points=[
-                "The language used is emotionally charged",
-                "Historical context can provide perspective",
-                "Consider multiple sources before drawing conclusions"
-            ],
-            sentiment=-0.7,
-            tags=["finance", "market", "volatility"]
-        )
-    
-    # Mock meme
-    meme = None
-    if detox_request.include_meme:
-        meme = MemeImage(
-            text="When you panic sell and the market recovers",
-            style="frustrated-trader"
-        )
-    
-    return DetoxResponse(
-        id=str(uuid.uuid4()),
-        original_content=detox_request.content,
-        historical_parallels=historical_parallels,
-        analysis=analysis,
-        meme=meme,
-        metadata={
+    processed_at = _iso_now()
+    return {
+        "id": uuid.uuid4().hex,
+        "original_content": detox_request.content,
+        "processed_at": processed_at,
+        "historical_parallels": historical_parallels,
+        "analysis": analysis,
+        "meme": meme,
+        "metadata": {
             "content_type": detox_request.content_type,
             "user_id": user.get("sub"),
-            "processed_at": datetime.utcnow().isoformat()
-        }
-    )
+            "processed_at": processed_at
+        },
+    }
 
-@router.get("/history", response_model=List[DetoxResponse])
-async def get_detox_history(limit: int = 10, offset: int = 0, user: dict = Depends(get_current_user)):
+@router.get("/history", response_model=None, responses={200: {"model": List[DetoxResponse]}})
+async def get_detox_history(
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get user's detox history.
     
-    Returns a paginated list of previously processed detox items.
+    Returns a paginated list of previously processed detox items, newest
+    first. The total number of items is sent in the ``X-Total-Count`` header.
     """
-    # TODO: Implement actual history retrieval from database
-    # This is a placeholder implementation
-    return []
+    try:
+        user_id = uuid.UUID(user.get("sub"))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: malformed subject",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    items, total = await _fetch_history_page(db, user_id, limit, offset)
+    response.headers["X-Total-Count"] = str(total)
+    return items
+
+
+async def _fetch_history_page(
+    db: AsyncSession, user_id: uuid.UUID, limit: int, offset: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Load one page of a user's detox items and their total count.
+    
+    ``COUNT(*) OVER ()`` carries the total on every row, so the page and the
+    count come back in a single query. A page past the end has no rows to
+    carry it, so the total is then counted on its own.
+    """
+    owned = DetoxItem.user_id == user_id
+    stmt = (
+        select(DetoxItem, func.count().over().label("total"))
+        .where(owned)
+        .order_by(DetoxItem.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        # Only a page past the end needs the extra query; page one of an
+        # empty history is known to total 0
+        total = 0
+        if offset:
+            total = await db.scalar(select(func.count()).select_from(DetoxItem).where(owned))
+        return [], total
+    
+    items = [
+        {
+            "id": str(item.id),
+            "original_content": item.original_text,
+            "processed_at": item.created_at.isoformat() if item.created_at else None,
+            "historical_parallels": None,
+            "analysis": None,
+            "meme": None,
+            "metadata": item.metadata_ or {},
+        }
+        for item, _ in rows
+    ]
+    return items, rows[0].total
 
 @router.get("/{detox_id}", response_model=DetoxResponse)
 async def get_detox_item(detox_id: str, user: dict = Depends(get_current_user)):
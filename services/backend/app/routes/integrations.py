@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from collections import defaultdict
+from typing import DefaultDict, List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone
 
+import orjson
+
 from app.schemas.requests import IntegrationRequest, IntegrationConfig, IntegrationType
 from app.schemas.responses import IntegrationResponse, IntegrationStatus, ErrorResponse
 from app.core.security import get_current_user
@@ -21,11 +24,169 @@ router = APIRouter(
 # In a real app, this would be a database
 integrations_db: Dict[str, Dict[str, Any]] = {}
 
-@router.post("", response_model=IntegrationResponse)
+# Integration ids per user, so listing doesn't scan every user's rows. The
+# inner dicts serve as ordered sets, keeping ids in creation order.
+user_index: DefaultDict[str, Dict[str, None]] = defaultdict(dict)
+
+# Integration type metadata; static, so serialized once at import
+_INTEGRATION_TYPES_JSON = orjson.dumps([
+    {
+        "type": "telegram",
+        "name": "Telegram",
+        "description": "Connect your Telegram account to forward messages",
+        "icon": "telegram",
+        "settings_schema": {
+            "type": "object",
+            "required": ["api_token"],
+            "properties": {
+                "api_token": {
+                    "type": "string",
+                    "description": "Telegram bot API token"
+                },
+                "auto_forward": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Automatically forward new messages"
+                }
+            }
+        }
+    },
+    {
+        "type": "rss",
+        "name": "RSS Feed",
+        "description": "Subscribe to an RSS feed",
+        "icon": "rss",
+        "settings_schema": {
+            "type": "object",
+            "required": ["feed_url"],
+            "properties": {
+                "feed_url": {
+                    "type": "string",
+                    "format": "uri",
+                    "description": "URL of the RSS feed"
+                },
+                "poll_interval": {
+                    "type": "integer",
+                    "default": 3600,
+                    "description": "Polling interval in seconds"
+                }
+            }
+        }
+    }
+])
+
+def _require_owned(request: IntegrationRequest, user_id: str) -> Dict[str, Any]:
+    """Return the integration ``request`` targets, if ``user_id`` owns it."""
+    if not request.integration_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"integration_id is required for {request.action} action"
+        )
+    
+    integration = integrations_db.get(request.integration_id)
+    if integration is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Integration not found"
+        )
+    
+    if integration["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {request.action} this integration"
+        )
+    
+    return integration
+
+
+def _do_create(request: IntegrationRequest, user_id: str, now: datetime) -> Dict[str, Any]:
+    if not request.config:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Config is required for create action"
+        )
+    
+    integration_id = str(uuid.uuid4())
+    integration = {
+        "id": integration_id,
+        "user_id": user_id,
+        "type": request.config.type,
+        "status": IntegrationStatus.ACTIVE,
+        "settings": request.config.settings.model_dump(mode="json"),
+        "enabled": request.config.enabled,
+        "created_at": now,
+        "updated_at": now,
+        "last_synced": None,
+        "error": None,
+    }
+    integrations_db[integration_id] = integration
+    user_index[user_id][integration_id] = None
+    return integration
+
+
+def _do_update(request: IntegrationRequest, user_id: str, now: datetime) -> Dict[str, Any]:
+    integration = _require_owned(request, user_id)
+    if request.config:
+        integration.update({
+            "type": request.config.type,
+            "settings": request.config.settings.model_dump(mode="json"),
+            "enabled": request.config.enabled,
+            "updated_at": now,
+        })
+    return integration
+
+
+def _do_delete(request: IntegrationRequest, user_id: str, now: datetime) -> Dict[str, Any]:
+    integration = _require_owned(request, user_id)
+    del integrations_db[request.integration_id]
+    user_index[user_id].pop(request.integration_id, None)
+    return integration
+
+
+def _do_sync(request: IntegrationRequest, user_id: str, now: datetime) -> Dict[str, Any]:
+    integration = _require_owned(request, user_id)
+    # TODO: Implement actual sync logic
+    integration["last_synced"] = now
+    integration["updated_at"] = now
+    return integration
+
+
+# Action name -> handler applying it to the in-memory store
+_ACTIONS = {
+    "create": _do_create,
+    "update": _do_update,
+    "delete": _do_delete,
+    "sync": _do_sync,
+}
+
+# Fields of a stored integration that clients see, in IntegrationResponse
+# order; the owner's user_id and the last sync error stay server-side
+_PUBLIC_FIELDS = tuple(IntegrationResponse.model_fields)
+
+
+def _public(integration: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a stored integration onto the fields of IntegrationResponse."""
+    return {field: integration.get(field) for field in _PUBLIC_FIELDS}
+
+
+def _json_response(content: Any) -> Response:
+    """
+    Serialize ``content`` with UTC datetimes written as ``...Z``, the way
+    pydantic serializes IntegrationResponse.
+    """
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_UTC_Z),
+        media_type="application/json",
+    )
+
+# Handlers project the stored dicts and serialize them directly; the models
+# only document the schema. The rows are built server-side, so re-validating
+# them and walking them with jsonable_encoder would be wasted work.
+@router.post("", response_model=None, responses={200: {"model": IntegrationResponse}})
 async def manage_integration(
     request: IntegrationRequest,
     user: dict = Depends(get_current_user)
-) -> IntegrationResponse:
+) -> Response:
     """
     Create, update, or delete an integration.
     
@@ -35,123 +196,22 @@ async def manage_integration(
     - delete: Delete an integration
     - sync: Trigger a sync for an integration
     """
-    user_id = user.get("sub")
-    now = datetime.now(timezone.utc)
-    
-    if request.action == "create":
-        if not request.config:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Config is required for create action"
-            )
-        
-        integration_id = str(uuid.uuid4())
-        integration = {
-            "id": integration_id,
-            "user_id": user_id,
-            "type": request.config.type,
-            "status": IntegrationStatus.ACTIVE,
-            "settings": request.config.settings,
-            "enabled": request.config.enabled,
-            "created_at": now,
-            "updated_at": now,
-            "last_synced": None,
-        }
-        integrations_db[integration_id] = integration
-        
-        return IntegrationResponse(**integration)
-    
-    elif request.action == "update":
-        if not request.integration_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="integration_id is required for update action"
-            )
-        
-        if request.integration_id not in integrations_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Integration not found"
-            )
-        
-        integration = integrations_db[request.integration_id]
-        if integration["user_id"] != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this integration"
-            )
-        
-        if request.config:
-            integration.update({
-                "type": request.config.type,
-                "settings": request.config.settings,
-                "enabled": request.config.enabled,
-                "updated_at": now,
-            })
-        
-        return IntegrationResponse(**integration)
-    
-    elif request.action == "delete":
-        if not request.integration_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="integration_id is required for delete action"
-            )
-        
-        if request.integration_id not in integrations_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Integration not found"
-            )
-        
-        integration = integrations_db[request.integration_id]
-        if integration["user_id"] != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this integration"
-            )
-        
-        del integrations_db[request.integration_id]
-        return IntegrationResponse(**integration)
-    
-    elif request.action == "sync":
-        if not request.integration_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="integration_id is required for sync action"
-            )
-        
-        if request.integration_id not in integrations_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Integration not found"
-            )
-        
-        integration = integrations_db[request.integration_id]
-        if integration["user_id"] != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to sync this integration"
-            )
-        
-        # TODO: Implement actual sync logic
-        integration["last_synced"] = now
-        integration["updated_at"] = now
-        
-        return IntegrationResponse(**integration)
-    
-    else:
+    handler = _ACTIONS.get(request.action)
+    if handler is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid action: {request.action}"
         )
+    
+    integration = handler(request, user.get("sub"), datetime.now(timezone.utc))
+    return _json_response(_public(integration))
 
-@router.get("", response_model=List[IntegrationResponse])
+@router.get("", response_model=None, responses={200: {"model": List[IntegrationResponse]}})
 async def list_integrations(
     type: Optional[str] = None,
     enabled: Optional[bool] = None,
     user: dict = Depends(get_current_user)
-) -> List[IntegrationResponse]:
+) -> Response:
     """
     List all integrations for the current user.
     
@@ -159,70 +219,22 @@ async def list_integrations(
     """
     user_id = user.get("sub")
     
-    # Filter integrations by user_id
+    # Look up the user's rows by id and apply the filters in the same pass
     user_integrations = [
-        IntegrationResponse(**i) for i in integrations_db.values() 
-        if i["user_id"] == user_id
+        _public(i) for i in map(integrations_db.get, user_index.get(user_id, ()))
+        if i is not None
+        and (type is None or i["type"] == type)
+        and (enabled is None or i["enabled"] == enabled)
     ]
     
-    # Apply filters
-    if type is not None:
-        user_integrations = [i for i in user_integrations if i.type == type]
-    
-    if enabled is not None:
-        user_integrations = [i for i in user_integrations if i.enabled == enabled]
-    
-    return user_integrations
+    return _json_response(user_integrations)
+
 
-@router.get("/types", response_model=List[Dict[str, Any]])
-async def list_integration_types() -> List[Dict[str, Any]]:
+@router.get("/types", response_model=None)
+async def list_integration_types() -> Response:
     """
     List all available integration types.
     
     Returns metadata about each integration type, including required settings.
     """
-    return [
-        {
-            "type": "telegram",
-            "name": "Telegram",
-            "description": "Connect your Telegram account to forward messages",
-            "icon": "telegram",
-            "settings_schema": {
-                "type": "object",
-                "required": ["api_token"],
-                "properties": {
-                    "api_token": {
-                        "type": "string",
-                        "description": "Telegram bot API token"
-                    },
-                    "auto_forward": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Automatically forward new messages"
-                    }
-                }
-            }
-        },
-        {
-            "type": "rss",
-            "name": "RSS Feed",
-            "description": "Subscribe to an RSS feed",
-            "icon": "rss",
-            "settings_schema": {
-                "type": "object",
-                "required": ["feed_url"],
-                "properties": {
-                    "feed_url": {
-                        "type": "string",
-                        "format": "uri",
-                        "description": "URL of the RSS feed"
-                    },
-                    "poll_interval": {
-                        "type": "integer",
-                        "default": 3600,
-                        "description": "Polling interval in seconds"
-                    }
-                }
-            }
-        }
-    ]
+    return Response(content=_INTEGRATION_TYPES_JSON, media_type="application/json")
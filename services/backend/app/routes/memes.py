@@ -22,8 +22,9 @@ router.include_router(
 )
 
 # Log all registered meme routes
-for route in router.routes:
-    logger.info(f"Registered meme route: {route.path} - {', '.join(route.methods)}")
+if logger.isEnabledFor(logging.DEBUG):
+    for route in router.routes:
+        logger.debug("Registered meme route: %s - %s", route.path, ", ".join(route.methods))
 
 # Make router available for direct import
 __all__ = ["router"]
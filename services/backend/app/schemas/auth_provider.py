@@ -19,10 +19,10 @@ class AuthProvider(str, Enum):
     def from_string(cls, provider: str) -> 'AuthProvider':
         """Convert a string to an AuthProvider enum value."""
         provider = provider.lower()
-        for p in cls:
-            if p.value == provider:
-                return p
-        raise ValueError(f"Unknown provider: {provider}")
+        try:
+            return PROVIDER_MAP[provider]
+        except KeyError:
+            raise ValueError(f"Unknown provider: {provider}") from None
 
 # Map provider strings to AuthProvider enum
 PROVIDER_MAP: Dict[str, AuthProvider] = {
@@ -38,25 +38,29 @@ PROVIDER_MAP: Dict[str, AuthProvider] = {
     "magic_link": AuthProvider.MAGIC_LINK,
 }
 
+# Providers grouped by kind, for the is_*_provider checks
+_SOCIAL_PROVIDERS = frozenset({
+    AuthProvider.GOOGLE,
+    AuthProvider.GITHUB,
+    AuthProvider.APPLE,
+    AuthProvider.FACEBOOK,
+    AuthProvider.TWITTER,
+    AuthProvider.MICROSOFT,
+    AuthProvider.DISCORD,
+})
+_EMAIL_PROVIDERS = frozenset({AuthProvider.EMAIL, AuthProvider.MAGIC_LINK})
+
 def get_auth_provider(provider_str: str) -> Optional[AuthProvider]:
     """Get the AuthProvider enum for a provider string."""
     return PROVIDER_MAP.get(provider_str.lower())
 
 def is_social_provider(provider: AuthProvider) -> bool:
     """Check if a provider is a social provider (OAuth)."""
-    return provider in [
-        AuthProvider.GOOGLE,
-        AuthProvider.GITHUB,
-        AuthProvider.APPLE,
-        AuthProvider.FACEBOOK,
-        AuthProvider.TWITTER,
-        AuthProvider.MICROSOFT,
-        AuthProvider.DISCORD,
-    ]
+    return provider in _SOCIAL_PROVIDERS
 
 def is_email_provider(provider: AuthProvider) -> bool:
     """Check if a provider is an email-based provider."""
-    return provider in [AuthProvider.EMAIL, AuthProvider.MAGIC_LINK]
+    return provider in _EMAIL_PROVIDERS
 
 def is_phone_provider(provider: AuthProvider) -> bool:
     """Check if a provider is a phone-based provider."""
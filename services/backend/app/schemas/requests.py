@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, HttpUrl
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationInfo, field_validator
+from typing import List, Optional, Dict, Any, Type, Union
 from datetime import datetime
 from enum import Enum
 
@@ -85,12 +85,50 @@ class IntegrationType(str, Enum):
     RSS = "rss"
     CUSTOM = "custom"
 
+class IntegrationSettings(BaseModel):
+    """Base settings for an integration; unknown keys are kept as-is."""
+    model_config = ConfigDict(extra="allow")
+
+class TelegramSettings(IntegrationSettings):
+    """Settings for a Telegram integration."""
+    api_token: str
+    auto_forward: bool = True
+
+class RssSettings(IntegrationSettings):
+    """Settings for an RSS feed integration."""
+    feed_url: HttpUrl
+    poll_interval: int = 3600
+
+class TwitterSettings(IntegrationSettings):
+    """Settings for a Twitter integration."""
+
+class CustomSettings(IntegrationSettings):
+    """Settings for a custom integration."""
+
+# Integration type -> model its settings are validated against
+INTEGRATION_SETTINGS: Dict[IntegrationType, Type[IntegrationSettings]] = {
+    IntegrationType.TELEGRAM: TelegramSettings,
+    IntegrationType.RSS: RssSettings,
+    IntegrationType.TWITTER: TwitterSettings,
+    IntegrationType.CUSTOM: CustomSettings,
+}
+
 class IntegrationConfig(BaseModel):
     """Configuration for an integration."""
     type: IntegrationType
-    settings: Dict[str, Any]
+    settings: Union[TelegramSettings, RssSettings, TwitterSettings, CustomSettings]
     enabled: bool = True
     last_synced: Optional[datetime] = None
+    
+    @field_validator("settings", mode="before")
+    @classmethod
+    def validate_settings(cls, v: Any, info: ValidationInfo) -> Any:
+        # Validate against the model for ``type`` only, rather than trying
+        # each member of the union in turn
+        integration_type = info.data.get("type")
+        if integration_type is None or isinstance(v, IntegrationSettings):
+            return v
+        return INTEGRATION_SETTINGS[integration_type].model_validate(v)
 
 class IntegrationRequest(BaseModel):
     """Request model for managing integrations."""
@@ -0,0 +1,34 @@
+"""Pydantic models for creating and updating users."""
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+
+class UserCreate(BaseModel):
+    """Data for creating a user; OAuth and phone users have no password."""
+    model_config = ConfigDict(populate_by_name=True)
+    
+    email: EmailStr = Field(..., description="The user's email address")
+    password: Optional[str] = Field(None, description="Plain-text password, hashed on create")
+    full_name: Optional[str] = Field(None, description="The user's full name")
+    avatar_url: Optional[str] = Field(None, description="URL to the user's avatar image")
+    timezone: Optional[str] = Field("UTC", description="The user's timezone")
+    locale: Optional[str] = Field("en-US", description="The user's locale")
+    is_active: Optional[bool] = Field(True, description="Whether the account is active")
+    is_verified: Optional[bool] = Field(False, description="Whether the user is verified")
+    metadata_: Dict[str, Any] = Field(default_factory=dict, alias="metadata")
+
+
+class UserUpdate(BaseModel):
+    """Fields of a user that may be changed; unset fields are left alone."""
+    model_config = ConfigDict(populate_by_name=True)
+    
+    email: Optional[EmailStr] = None
+    password: Optional[str] = None
+    full_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+    timezone: Optional[str] = None
+    locale: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_verified: Optional[bool] = None
+    metadata_: Optional[Dict[str, Any]] = Field(None, alias="metadata")
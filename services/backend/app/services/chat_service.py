@@ -1,7 +1,7 @@
 """Chat service for handling chat functionality."""
+from datetime import datetime
 from typing import Dict, Any, Optional
 from app.schemas.requests import ChatRequest
-from app.schemas.responses import ChatMessageResponse, ChatResponse
 import uuid
 
 class ChatService:
@@ -18,16 +18,18 @@ class ChatService:
         Returns:
             Dict containing the chat response and conversation ID
         """
-        # Create a mock response
-        response_message = ChatMessageResponse(
-            id=str(uuid.uuid4()),
-            role="assistant",
-            content=f"Response to: {chat_request.messages[-1].content}"
-        )
+        # Create a mock response, shaped like ChatMessageResponse
+        response_message = {
+            "id": uuid.uuid4().hex,
+            "role": "assistant",
+            "content": f"Response to: {chat_request.messages[-1].content}",
+            "timestamp": datetime.utcnow().isoformat(),
+            "metadata": {},
+        }
         
         return {
             "message": response_message,
-            "conversation_id": str(uuid.uuid4()),
+            "conversation_id": uuid.uuid4().hex,
             "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
             "finish_reason": "stop"
         }
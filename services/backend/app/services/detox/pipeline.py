@@ -296,7 +296,7 @@ Make it funny but not offensive."""
                 entities=entities,
                 similar_items=similar_items,
                 meme_task_id=meme_data.get("task_id") if meme_data else None,
-                metadata={
+                metadata_={
                     "key_points": analysis.get("key_points", []),
                     "meme_status": meme_data.get("status") if meme_data else None
                 }
@@ -9,9 +9,7 @@ from fastapi import HTTPException, status, Depends, Request
 
 from app.core.config import settings
 from app.core.security import get_current_user
-from app.services.supabase_client import get_supabase_client
-from app.models.user import User, UserCreate, UserUpdate
-from app.db.crud.users import get_user_by_id, create_user, update_user
+from app.services.supabase_client import get_supabase_admin, get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +18,7 @@ class SupabaseAuthService:
     
     def __init__(self):
         self.supabase = get_supabase_client()
-        self.admin = get_supabase_admin_client()
+        self.admin = get_supabase_admin()
     
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email from Supabase Auth."""
@@ -7,8 +7,10 @@ import os
 from supabase import create_client, Client as SupabaseClient
 from app.core.config import settings
 
-# Global Supabase client instance
+# Global Supabase client instances. Each one owns an HTTP connection pool,
+# so they're created once and shared rather than built per call.
 _supabase: Optional[SupabaseClient] = None
+_supabase_admin: Optional[SupabaseClient] = None
 
 def get_supabase_client() -> SupabaseClient:
     """
@@ -39,7 +41,7 @@ def get_supabase_client() -> SupabaseClient:
 
 def get_supabase_admin() -> SupabaseClient:
     """
-    Get a Supabase client with admin privileges.
+    Get or create a Supabase client with admin privileges.
     
     Returns:
         SupabaseClient: Supabase client with admin privileges
@@ -47,12 +49,17 @@ def get_supabase_admin() -> SupabaseClient:
     Raises:
         RuntimeError: If Supabase service role key is not configured
     """
-    service_role_key = settings.SUPABASE_SERVICE_ROLE_KEY
+    global _supabase_admin
     
-    if not service_role_key:
-        raise RuntimeError(
-            "Supabase service role key is required for admin operations. "
-            "Please set SUPABASE_SERVICE_ROLE_KEY environment variable."
-        )
+    if _supabase_admin is None:
+        service_role_key = settings.SUPABASE_SERVICE_ROLE_KEY
+        
+        if not service_role_key:
+            raise RuntimeError(
+                "Supabase service role key is required for admin operations. "
+                "Please set SUPABASE_SERVICE_ROLE_KEY environment variable."
+            )
+        
+        _supabase_admin = create_client(settings.SUPABASE_URL, service_role_key)
     
-    return create_client(settings.SUPABASE_URL, service_role_key)
+    return _supabase_admin
@@ -8,7 +8,7 @@ import logging
 
 from fastapi import HTTPException, status, Depends
 from pydantic import EmailStr
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash, verify_password
 from app.db.session import get_db
@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service for user-related operations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     async def get_by_id(self, user_id: UUID) -> Optional[UserInDB]:
@@ -288,5 +288,5 @@ class UserService:
             )
 
 # Dependency to get the current user service
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
     return UserService(db)
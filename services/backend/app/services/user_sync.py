@@ -4,10 +4,11 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Set
 from uuid import UUID
 
-from fastapi import HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.db.deps import get_db
 from app.models.user_model import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.schemas.auth_provider import AuthProvider, get_auth_provider, is_social_provider, is_email_provider, is_phone_provider
@@ -236,5 +237,5 @@ class UserSyncService:
         return await self.sync_user_from_supabase(user_id)
 
 # Create a global instance for easy dependency injection
-async def get_user_sync_service(db: AsyncSession) -> UserSyncService:
+async def get_user_sync_service(db: AsyncSession = Depends(get_db)) -> UserSyncService:
     return UserSyncService(db)
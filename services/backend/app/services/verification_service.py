@@ -1,11 +1,12 @@
 """Service for handling user verification (email/phone)."""
 import logging
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.db.deps import get_db
 from app.models.user_model import User
 from app.schemas.auth_provider import AuthProvider, is_email_provider, is_phone_provider
 from app.services.supabase_auth import supabase_auth_service
@@ -221,5 +222,5 @@ class VerificationService:
             )
 
 # Dependency for FastAPI
-def get_verification_service(db: AsyncSession) -> VerificationService:
+def get_verification_service(db: AsyncSession = Depends(get_db)) -> VerificationService:
     return VerificationService(db)
@@ -0,0 +1,41 @@
+"""Detox pipeline tasks using Celery."""
+import logging
+from typing import Optional
+from uuid import UUID
+
+import uvloop
+from celery import shared_task
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="detox.process", queue="detox", ignore_result=True)
+def process_detox(
+    detox_id: str,
+    text: str,
+    generate_meme: bool = True,
+    user_id: Optional[str] = None,
+) -> None:
+    """
+    Celery task to run a stored detox item through the detox pipeline.
+    
+    Args:
+        detox_id: ID of the detox item
+        text: Text to process
+        generate_meme: Whether to generate a meme if content is sensational
+        user_id: Optional user ID for attribution
+    """
+    # Imported here so the web process can dispatch without loading the pipeline
+    from app.api.endpoints.detox import process_detox_background
+    
+    # uvloop.run() uses uvloop for this run only, leaving the process-wide
+    # event loop policy alone for the web code that imports this module
+    uvloop.run(
+        process_detox_background(
+            detox_id=UUID(detox_id),
+            text=text,
+            generate_meme=generate_meme,
+            user_id=UUID(user_id) if user_id else None,
+        )
+    )
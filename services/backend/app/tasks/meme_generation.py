@@ -180,7 +180,14 @@ def store_meme_in_supabase(
         logger.error(f"Error storing meme in Supabase: {e}")
         raise
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60, queue="memes")
+@shared_task(
+    bind=True,
+    name="memes.generate",
+    ignore_result=False,  # Polled by the meme status endpoint
+    max_retries=3,
+    default_retry_delay=60,
+    queue="memes",
+)
 def generate_meme(self, headline: str, analysis: str, style: str) -> Dict[str, str]:
     """
     Celery task to generate a meme.
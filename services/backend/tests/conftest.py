@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import FastAPI, status, Depends
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from unittest.mock import patch, MagicMock
 import os
@@ -13,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.main import app as main_app
 from app.core.config import settings
-from app.core.security import get_current_user, security
+from app.core.security import get_current_user, security, verify_token
 
 @pytest.fixture(scope="module")
 def app():
@@ -24,12 +25,13 @@ def app():
         description="Test API for ZeitWise application",
         version="0.1.0",
         docs_url=None,  # Disable docs for tests
-        redoc_url=None
+        redoc_url=None,
+        default_response_class=ORJSONResponse,
     )
     
     # Include all API routers
-    from app.routes import api_router
-    test_app.include_router(api_router, prefix="/api")
+    from app.routes import register_all
+    register_all(test_app)
     
     # Include the ping endpoint for health checks
     from app.main import ping, healthz
@@ -40,7 +42,7 @@ def app():
     from fastapi.middleware.cors import CORSMiddleware
     test_app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.BACKEND_CORS_ORIGINS or [],
+        allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -91,6 +93,7 @@ def override_dependencies(app):
     # Override the dependencies
     from app.routes import chat, detox, integrations
     app.dependency_overrides[get_current_user] = mock_get_current_user
+    app.dependency_overrides[verify_token] = mock_get_current_user
     app.dependency_overrides[security] = mock_security
     
     # Mock chat service if it exists
@@ -0,0 +1,27 @@
+"""Tests for application settings."""
+from app.core.config import Settings
+
+
+def test_cors_origins_are_normalized_strings():
+    """Test CORS origins are precomputed as plain strings without trailing slashes."""
+    settings = Settings(BACKEND_CORS_ORIGINS="http://localhost:3000, https://app.example.com/")
+    
+    assert settings.CORS_ORIGINS == frozenset({
+        "http://localhost:3000",
+        "https://app.example.com",
+    })
+    assert all(type(origin) is str for origin in settings.CORS_ORIGINS)
+
+
+def test_cors_origins_computed_once():
+    """Test the normalized origins are cached on the settings instance."""
+    settings = Settings()
+    
+    assert settings.CORS_ORIGINS is settings.CORS_ORIGINS
+
+
+def test_feature_set_parses_comma_separated_names():
+    """Test FEATURES is split into a set of trimmed, non-empty names."""
+    settings = Settings(FEATURES="auth, memes,,")
+    
+    assert settings.FEATURE_SET == frozenset({"auth", "memes"})
@@ -0,0 +1,120 @@
+"""Tests for FastAPI dependencies in app.api.deps."""
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api import deps
+
+MOCK_PAYLOAD = {
+    "sub": "user-123",
+    "aud": "authenticated",
+    "exp": int(time.time()) + 3600,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_jwt_cache():
+    """Start every test with an empty JWT cache."""
+    deps._jwt_cache.clear()
+    yield
+    deps._jwt_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_caches_decoded_token():
+    """Repeat calls with the same token only verify the signature once."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    
+    with patch("app.api.deps.jwt.decode", return_value=MOCK_PAYLOAD) as mock_decode:
+        assert await deps.get_current_user_id(MagicMock(), credentials) == "user-123"
+        assert await deps.get_current_user_id(MagicMock(), credentials) == "user-123"
+    
+    mock_decode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_ignores_expired_cache_entry():
+    """A cached payload past its exp claim is re-verified."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    expired = {**MOCK_PAYLOAD, "exp": int(time.time()) - 1}
+    
+    with patch("app.api.deps.jwt.decode", return_value=expired) as mock_decode:
+        await deps.get_current_user_id(MagicMock(), credentials)
+        await deps.get_current_user_id(MagicMock(), credentials)
+    
+    assert mock_decode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_id_does_not_cache_failures():
+    """Invalid tokens are not cached."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="bad")
+    
+    with patch("app.api.deps.jwt.decode", side_effect=deps.JWTError("bad")):
+        assert await deps.get_current_user_id(MagicMock(), credentials) is None
+    
+    assert len(deps._jwt_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_required_user_id_ignores_token_roles():
+    """An admin role in the token grants nothing; only the subject is used."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    admin = {**MOCK_PAYLOAD, "app_metadata": {"roles": ["admin"]}}
+    
+    with patch("app.api.deps.jwt.decode", return_value=admin):
+        assert await deps.get_required_user_id(MagicMock(), credentials) == "user-123"
+
+
+@pytest.mark.asyncio
+async def test_is_superuser_reads_cached_db_flag():
+    """The superuser flag comes from users.is_superuser and is cached."""
+    deps._superuser_cache.clear()
+    user_id = str(uuid4())
+    db = MagicMock()
+    db.scalar = AsyncMock(return_value=True)
+    
+    assert await deps.is_superuser(db, user_id) is True
+    assert await deps.is_superuser(db, user_id) is True
+    db.scalar.assert_awaited_once()
+    
+    deps.invalidate_user(user_id)
+    db.scalar.return_value = None  # No local row
+    assert await deps.is_superuser(db, user_id) is False
+    
+    # Subjects that can't be a local user ID never reach the database
+    assert await deps.is_superuser(db, "user-123") is False
+    assert db.scalar.await_count == 2
+    
+    deps._superuser_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_user_cache():
+    """A recently synced user is served without another sync."""
+    deps._user_cache.clear()
+    user = deps.User(id=uuid4(), email="user@example.com")
+    user_sync = MagicMock()
+    user_sync.sync_user_from_supabase = AsyncMock(return_value=user)
+    db = MagicMock()
+    db.merge = AsyncMock(side_effect=lambda instance, load: instance)
+    
+    with patch("app.api.deps.get_current_user_id", AsyncMock(return_value="user-123")):
+        assert await deps.get_current_user(MagicMock(), db, user_sync) is user
+        cached = await deps.get_current_user(MagicMock(), db, user_sync)
+        user_sync.sync_user_from_supabase.assert_awaited_once_with("user-123")
+        
+        # Cache hits are a fresh instance merged into the request's session
+        assert cached is not user
+        assert cached.id == user.id
+        assert cached.email == user.email
+        db.merge.assert_awaited_once_with(cached, load=False)
+        
+        deps.invalidate_user("user-123")
+        await deps.get_current_user(MagicMock(), db, user_sync)
+        assert user_sync.sync_user_from_supabase.await_count == 2
+    
+    deps._user_cache.clear()
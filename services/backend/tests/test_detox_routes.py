@@ -0,0 +1,40 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import status
+
+from app.routes.detox import _fetch_history_page
+
+# Test client is provided by the client fixture in conftest.py
+
+def test_detox_history_rejects_non_uuid_subject(authenticated_client):
+    """A token whose subject isn't a UUID is rejected before any query."""
+    # The mocked user's sub ("auth0|1234567890") is not a UUID
+    response = authenticated_client.get("/api/detox/history")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+@pytest.mark.asyncio
+async def test_history_page_past_the_end_reports_real_total():
+    """An offset past the last item still reports how many items there are."""
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    db.scalar = AsyncMock(return_value=7)
+    
+    items, total = await _fetch_history_page(db, uuid.uuid4(), limit=10, offset=50)
+    
+    assert items == []
+    assert total == 7
+    db.scalar.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_empty_history_skips_count_query():
+    """The first page of an empty history needs no separate count."""
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    db.scalar = AsyncMock()
+    
+    items, total = await _fetch_history_page(db, uuid.uuid4(), limit=10, offset=0)
+    
+    assert (items, total) == ([], 0)
+    db.scalar.assert_not_awaited()
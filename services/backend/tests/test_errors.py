@@ -0,0 +1,34 @@
+"""Tests for shared endpoint error handling."""
+import pytest
+from fastapi import HTTPException, status
+
+from app.core.errors import safe_endpoint
+
+
+@pytest.mark.asyncio
+async def test_safe_endpoint_wraps_unexpected_errors():
+    """Test unexpected exceptions become an HTTPException with the given detail."""
+    @safe_endpoint("An error occurred during {provider} login")
+    async def endpoint(provider: str):
+        raise RuntimeError("boom")
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await endpoint(provider="github")
+    
+    assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert exc_info.value.detail == "An error occurred during github login"
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_safe_endpoint_passes_http_exceptions_through():
+    """Test HTTPExceptions raised by the endpoint are not rewritten."""
+    @safe_endpoint("Could not refresh session", status.HTTP_401_UNAUTHORIZED)
+    async def endpoint():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="nope")
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await endpoint()
+    
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+    assert exc_info.value.detail == "nope"
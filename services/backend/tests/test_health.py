@@ -3,6 +3,8 @@ import pytest
 from fastapi import status
 from unittest.mock import patch
 
+from app.db.init_db import db_ready
+
 # Test the /ping endpoint
 def test_ping_endpoint(client):
     """Test the /ping endpoint returns expected response."""
@@ -20,6 +22,9 @@ def test_ping_endpoint(client):
 # Test the /healthz endpoint
 def test_healthz_endpoint(client):
     """Test the /healthz endpoint returns expected response."""
+    # Given
+    db_ready.set()
+    
     # When
     response = client.get("/healthz")
     
@@ -28,6 +33,19 @@ def test_healthz_endpoint(client):
     data = response.json()
     assert data == {"status": "ok"}
 
+# Test the /healthz endpoint before the database is initialized
+def test_healthz_endpoint_not_ready(client):
+    """Test the /healthz endpoint reports 503 until the database is ready."""
+    # Given
+    db_ready.clear()
+    
+    # When
+    response = client.get("/healthz")
+    
+    # Then
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"status": "starting"}
+
 # Test database health check failure
 def test_database_health_check_failure(client):
     """Test database health check failure."""
@@ -43,8 +43,34 @@ async def test_create_integration(authenticated_client, mock_auth):
     assert "id" in data
     assert "created_at" in data
     assert "updated_at" in data
-    # The user_id should be set by the mock_auth fixture
-    assert data["user_id"] == "auth0|1234567890"
+    # The owner's user_id is stored but not sent back
+    assert "user_id" not in data
+
+@pytest.mark.asyncio
+async def test_integration_response_keys(authenticated_client, mock_auth):
+    """Responses carry exactly the fields IntegrationResponse documents."""
+    response = authenticated_client.post(
+        "/api/integrations",
+        json={
+            "action": "create",
+            "config": {
+                "type": "telegram",
+                "settings": {"api_token": "test-token"},
+                "enabled": True
+            }
+        }
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert set(data) == set(IntegrationResponse.model_fields)
+    assert data["created_at"].endswith("Z")
+    # Round-trips through the documented model
+    IntegrationResponse.model_validate(data)
+    
+    response = authenticated_client.get("/api/integrations")
+    assert response.status_code == status.HTTP_200_OK
+    assert all(set(item) == set(IntegrationResponse.model_fields) for item in response.json())
 
 @pytest.mark.asyncio
 async def test_create_integration_missing_config(authenticated_client, mock_auth):
@@ -60,6 +86,23 @@ async def test_create_integration_missing_config(authenticated_client, mock_auth
     # The API returns a simple error message for missing config
     assert data["detail"] == "Config is required for create action"
 
+@pytest.mark.asyncio
+async def test_create_integration_invalid_settings(authenticated_client, mock_auth):
+    """Test creating an integration whose settings don't match its type."""
+    response = authenticated_client.post(
+        "/api/integrations",
+        json={
+            "action": "create",
+            "config": {
+                "type": "telegram",
+                "settings": {"feed_url": "http://example.com/feed"},
+                "enabled": True
+            }
+        }
+    )
+    
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 @pytest.fixture
 def test_integration_data():
     """Fixture providing test integration data."""
@@ -170,7 +213,9 @@ async def test_sync_integration(authenticated_client, mock_auth, test_integratio
 @pytest.mark.asyncio
 async def test_list_integrations(authenticated_client, mock_auth, test_integration_data):
     """Test listing integrations with filters."""
-    with patch("app.routes.integrations.integrations_db", test_integration_data):
+    test_user_index = {"auth0|1234567890": dict.fromkeys(test_integration_data)}
+    with patch("app.routes.integrations.integrations_db", test_integration_data), \
+         patch("app.routes.integrations.user_index", test_user_index):
         # List all integrations
         response = authenticated_client.get("/api/integrations")
         assert response.status_code == status.HTTP_200_OK
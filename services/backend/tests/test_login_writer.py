@@ -0,0 +1,75 @@
+"""Tests for the batched last-login writer."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.db import login_writer
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    """Start every test with an empty login queue."""
+    while not login_writer._queue.empty():
+        login_writer._queue.get_nowait()
+    yield
+
+
+@pytest.fixture
+def running_writer():
+    """Treat the background writer as running, so logins are queued."""
+    with patch("app.db.login_writer._running", return_value=True):
+        yield
+
+
+def mock_session_factory():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+@pytest.mark.asyncio
+async def test_collect_coalesces_duplicate_logins(running_writer):
+    """Test repeated logins by one user are written once per batch."""
+    first, second = uuid4(), uuid4()
+    for user_id in (first, second, first):
+        await login_writer.enqueue(user_id)
+    
+    ids = await login_writer._collect()
+    
+    assert ids == {first, second}
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_logins_in_one_update(running_writer):
+    """Test stopping the writer flushes queued logins with a single UPDATE."""
+    factory, session = mock_session_factory()
+    user_ids = [uuid4() for _ in range(3)]
+    for user_id in user_ids:
+        await login_writer.enqueue(user_id)
+    
+    with patch("app.db.login_writer.AsyncSessionLocal", factory):
+        await login_writer.stop()
+    
+    session.execute.assert_awaited_once()
+    params = session.execute.await_args.args[1]
+    assert sorted(params["ids"]) == sorted(user_ids)
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_writes_directly_without_writer():
+    """Test a login is written at once when no writer drains the queue."""
+    factory, session = mock_session_factory()
+    user_id = uuid4()
+    
+    with patch("app.db.login_writer.AsyncSessionLocal", factory):
+        await login_writer.enqueue(user_id)
+    
+    assert login_writer._queue.empty()
+    params = session.execute.await_args.args[1]
+    assert params["ids"] == [user_id]
+    session.commit.assert_awaited_once()
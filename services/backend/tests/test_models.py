@@ -0,0 +1,30 @@
+"""Tests for shared model helpers."""
+import time
+
+from app.models.base import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Test uuid7 sets the RFC 9562 version and variant bits."""
+    value = uuid7()
+    
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_timestamp():
+    """Test the leading 48 bits carry the current Unix time in milliseconds."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_is_time_ordered():
+    """Test UUIDs generated in later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    
+    assert first < second
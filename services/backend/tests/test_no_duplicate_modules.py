@@ -0,0 +1,20 @@
+"""Tests guarding against duplicate application entry points."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+
+@pytest.mark.parametrize("module, relative_path", [
+    ("app.main", "main.py"),
+    ("app.routes", "routes/__init__.py"),
+])
+def test_module_resolves_uniquely(module, relative_path):
+    """Test each entry-point module has exactly one copy in the app package."""
+    spec = importlib.util.find_spec(module)
+    
+    assert spec is not None
+    assert Path(spec.origin).resolve() == APP_DIR / relative_path
+    assert len(list(APP_DIR.rglob(relative_path))) == 1
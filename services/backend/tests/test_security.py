@@ -9,7 +9,7 @@ import asyncio
 from fastapi import HTTPException, status, Request
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.core import security
+from app.core import http, security
 from app.core.config import settings
 
 # Mock request object for testing
@@ -89,7 +89,8 @@ def mock_async_client():
         mock_response.json = AsyncMock(return_value=MOCK_JWKS)
         
         # Configure the client to return the mock response
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.is_closed = False
+        mock_client.return_value.get = AsyncMock(return_value=mock_response)
         
         yield mock_client, mock_response
 
@@ -104,15 +105,15 @@ async def test_get_jwks_success(mock_async_client):
     # Verify the results
     assert jwks == MOCK_JWKS
     
-    # Verify the client was used correctly
-    mock_client.return_value.__aenter__.assert_awaited_once()
-    mock_client.return_value.__aexit__.assert_awaited_once()
-    
-    # Verify the request was made correctly
-    mock_client.return_value.__aenter__.return_value.get.assert_awaited_once_with(
+    # Verify the request was made correctly through the shared client
+    mock_client.return_value.get.assert_awaited_once_with(
         f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json"
     )
     
+    # A second fetch reuses the same client
+    await security.get_jwks()
+    mock_client.assert_called_once()
+    
     # Verify the response was handled correctly
     mock_response.raise_for_status.assert_awaited_once()
     mock_response.json.assert_awaited_once()
@@ -121,11 +122,23 @@ async def test_get_jwks_success(mock_async_client):
 async def test_get_jwks_failure():
     """Test failure when retrieving JWKS."""
     with patch('httpx.AsyncClient') as mock_client:
-        mock_client.return_value.__aenter__.return_value.get.side_effect = Exception("Network error")
+        mock_client.return_value.get = AsyncMock(side_effect=Exception("Network error"))
         with pytest.raises(HTTPException) as exc_info:
             await security.get_jwks()
         assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
+@pytest.fixture(autouse=True)
+def reset_jwks_cache():
+    """Start every test with an empty JWKS cache."""
+    security._jwks = ({}, 0.0)
+    security._jwks_refresh = None
+    security._token_cache = None
+    http._client = None
+    yield
+    security._jwks = ({}, 0.0)
+    security._jwks_refresh = None
+    security._token_cache = None
+
 @pytest.mark.asyncio
 async def test_get_public_key_success():
     """Test getting public key with valid key ID."""
@@ -134,16 +147,66 @@ async def test_get_public_key_success():
         key = await security.get_public_key("test_kid")
         assert key == MOCK_JWKS["keys"][0]
         
+        # Second call - served from the cache
+        key = await security.get_public_key("test_kid")
+        assert key == MOCK_JWKS["keys"][0]
+        
         # Clear the cache to simulate a fresh call
-        security.jwks_cache.clear()
+        security._jwks = ({}, 0.0)
         
-        # Second call - should call get_jwks again
+        # Third call - should call get_jwks again
         key = await security.get_public_key("test_kid")
         assert key == MOCK_JWKS["keys"][0]
         
-        # Should have been called twice (no caching in this test)
         assert mock_get_jwks.call_count == 2
 
+@pytest.mark.asyncio
+async def test_get_public_key_concurrent_cold_start():
+    """Test concurrent first requests share a single JWKS fetch."""
+    async def slow_jwks():
+        await asyncio.sleep(0.01)
+        return MOCK_JWKS
+    
+    with patch('app.core.security.get_jwks', side_effect=slow_jwks) as mock_get_jwks:
+        keys = await asyncio.gather(*(security.get_public_key("test_kid") for _ in range(5)))
+        
+        assert all(key == MOCK_JWKS["keys"][0] for key in keys)
+        assert mock_get_jwks.call_count == 1
+
+@pytest.mark.asyncio
+async def test_get_public_key_stale_revalidates_in_background():
+    """Test a stale cache is served while a refresh runs in the background."""
+    stale_key = {"kid": "test_kid", "alg": "RS256", "n": "old"}
+    security._jwks = (
+        {"test_kid": stale_key},
+        time.monotonic() - security.JWKS_TTL_SECONDS - 1,
+    )
+    
+    with patch('app.core.security.get_jwks', return_value=MOCK_JWKS) as mock_get_jwks:
+        key = await security.get_public_key("test_kid")
+        assert key == stale_key
+        
+        await security._jwks_refresh
+        assert mock_get_jwks.call_count == 1
+        assert await security.get_public_key("test_kid") == MOCK_JWKS["keys"][0]
+
+@pytest.mark.asyncio
+async def test_get_public_key_keeps_oversized_key_set(caplog):
+    """Test a JWKS over JWKS_MAX_KEYS is kept whole, with a warning."""
+    many_keys = {
+        "keys": [
+            {**MOCK_JWKS["keys"][0], "kid": f"kid_{i}"}
+            for i in range(security.JWKS_MAX_KEYS + 10)
+        ]
+    }
+    with patch('app.core.security.get_jwks', return_value=many_keys):
+        # A key past the threshold still verifies
+        assert await security.get_public_key(f"kid_{security.JWKS_MAX_KEYS + 9}")
+        
+        keys, _ = security._jwks
+        assert len(keys) == security.JWKS_MAX_KEYS + 10
+    assert f"JWKS has {security.JWKS_MAX_KEYS + 10} keys" in caplog.text
+
 @pytest.mark.asyncio
 async def test_get_public_key_not_found():
     """Test getting public key with invalid key ID."""
@@ -172,6 +235,39 @@ async def test_decode_jwt_success():
         mock_header.assert_called_once_with("test_token")
         mock_decode.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_decode_jwt_reuses_verified_token():
+    """Test a recently verified token skips the key lookup and signature check."""
+    with patch('app.core.security.get_public_key') as mock_get_pub_key, \
+         patch('jose.jwt.get_unverified_header') as mock_header, \
+         patch('jose.jwt.decode') as mock_decode:
+        mock_header.return_value = {"kid": "test_kid", "alg": "RS256"}
+        mock_get_pub_key.return_value = {"kty": "RSA", "n": "test_n_value", "e": "AQAB", "alg": "RS256"}
+        mock_decode.return_value = MOCK_PAYLOAD
+        
+        first = await security.decode_jwt("test_token")
+        second = await security.decode_jwt("test_token")
+        
+        assert first == second == MOCK_PAYLOAD
+        mock_get_pub_key.assert_called_once()
+        mock_decode.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_decode_jwt_expired_token_not_served_from_cache():
+    """Test a cached payload is re-verified once its exp has passed."""
+    expired = {**MOCK_PAYLOAD, "exp": int(time.time()) - 1}
+    with patch('app.core.security.get_public_key') as mock_get_pub_key, \
+         patch('jose.jwt.get_unverified_header') as mock_header, \
+         patch('jose.jwt.decode') as mock_decode:
+        mock_header.return_value = {"kid": "test_kid", "alg": "RS256"}
+        mock_get_pub_key.return_value = {"kty": "RSA", "n": "test_n_value", "e": "AQAB", "alg": "RS256"}
+        mock_decode.return_value = expired
+        
+        await security.decode_jwt("test_token")
+        await security.decode_jwt("test_token")
+        
+        assert mock_decode.call_count == 2
+
 @pytest.mark.asyncio
 async def test_decode_jwt_missing_kid():
     """Test JWT decoding with missing key ID."""
@@ -232,6 +328,25 @@ async def test_get_current_user_invalid_token():
         assert "WWW-Authenticate" in exc_info.value.headers
         mock_decode.assert_called_once_with("invalid_token")
 
+@pytest.mark.asyncio
+async def test_verify_token_returns_payload():
+    """Test verify_token returns the verified payload without building user info."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="valid.token.here")
+    with patch('app.core.security.decode_jwt', new=AsyncMock(return_value=MOCK_PAYLOAD)):
+        payload = await security.verify_token(credentials)
+    
+    assert payload == MOCK_PAYLOAD
+
+@pytest.mark.asyncio
+async def test_verify_token_rejects_invalid_token():
+    """Test verify_token answers an invalid token with a 401."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid.token.here")
+    with patch('app.core.security.decode_jwt', new=AsyncMock(side_effect=JWTError("bad"))):
+        with pytest.raises(HTTPException) as exc_info:
+            await security.verify_token(credentials)
+    
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
 @pytest.mark.asyncio
 async def test_get_required_roles():
     """Test role-based access control"""
@@ -324,14 +439,15 @@ async def test_decode_jwt_expired():
 async def test_get_public_key_error_handling():
     """Test error handling when getting public key fails."""
     # First call to populate cache with empty keys
-    with patch('app.core.security.jwks_cache', {}):
-        with patch('app.core.security.get_jwks') as mock_get_jwks:
-            mock_get_jwks.return_value = {"keys": []}  # No keys in JWKS
-            with pytest.raises(HTTPException) as exc_info:
-                await security.get_public_key("nonexistent_kid")
-            
-            assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-            assert "Invalid token: unknown key ID" in str(exc_info.value.detail)
+    with patch('app.core.security.get_jwks') as mock_get_jwks:
+        mock_get_jwks.return_value = {"keys": []}  # No keys in JWKS
+        with pytest.raises(HTTPException) as exc_info:
+            await security.get_public_key("nonexistent_kid")
+        
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Invalid token: unknown key ID" in str(exc_info.value.detail)
+        # The freshly fetched JWKS isn't refetched for the unknown kid
+        assert mock_get_jwks.call_count == 1
 
 @pytest.mark.asyncio
 async def test_get_current_user_malformed_token():
@@ -345,3 +461,22 @@ async def test_get_current_user_malformed_token():
         
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "Could not validate credentials" in str(exc_info.value.detail)
+
+@pytest.mark.asyncio
+async def test_get_password_hash_async_round_trip():
+    """Test passwords hashed off the event loop verify against the plain text."""
+    hashed = await security.get_password_hash_async("correct horse")
+    
+    assert hashed != "correct horse"
+    assert security.verify_password("correct horse", hashed)
+    assert not security.verify_password("wrong horse", hashed)
+
+def test_token_cache_reads_ttl_on_first_use():
+    """The token cache takes AUTH_CACHE_TTL as configured when first used."""
+    with patch.object(settings, "AUTH_CACHE_TTL", 0):
+        assert security._get_token_cache() is None
+    
+    with patch.object(settings, "AUTH_CACHE_TTL", 7):
+        cache = security._get_token_cache()
+        assert cache.ttl == 7
+        assert security._get_token_cache() is cache